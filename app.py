@@ -2,10 +2,11 @@
 Flask web application for keeping the bot alive on Render
 """
 
-from flask import Flask, render_template_string
-import threading
-import time
+import asyncio
 import logging
+import os
+import threading
+from flask import Flask, Response
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -13,10 +14,8 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
-@app.route('/')
-def home():
-    """Home page"""
-    return render_template_string('''
+# Static responses, built once at import
+_HOME_HTML = '''
     <!DOCTYPE html>
     <html>
     <head>
@@ -56,30 +55,43 @@ def home():
         </div>
     </body>
     </html>
-    ''')
+    '''
+_PING_BODY = b'{"message":"Bot is running","status":"ok"}'
+_HEALTH_BODY = b'{"service":"MultiLangTranslator Bot","status":"healthy"}'
+
+@app.route('/')
+def home():
+    """Home page"""
+    return _HOME_HTML
 
 @app.route('/ping')
 def ping():
     """Ping endpoint for uptime monitoring"""
-    return {'status': 'ok', 'message': 'Bot is running'}
+    return Response(_PING_BODY, mimetype="application/json")
 
 @app.route('/health')
 def health():
     """Health check endpoint"""
-    return {'status': 'healthy', 'service': 'MultiLangTranslator Bot'}
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 def run_bot():
     """Run the Telegram bot in a separate thread"""
     try:
         logger.info("Starting bot thread...")
         from main import main
-        main()
-    except Exception as e:
-        logger.error(f"Error running bot: {e}")
-
-import os
-import threading
-import time
+        # Worker threads have no event loop until one is set
+        asyncio.set_event_loop(asyncio.new_event_loop())
+        # Flask serves the health endpoints on PORT here
+        main(serve_health=False)
+    except Exception:
+        logger.critical("Fatal error running bot", exc_info=True)
+    else:
+        logger.critical("Bot stopped")
+    # Exit the whole process so the platform restarts it with its own
+    # backoff, instead of leaving Flask answering health checks for a
+    # dead bot; sys.exit would only end this thread
+    logging.shutdown()
+    os._exit(1)
 
 if __name__ == '__main__':
     # Start bot in a separate thread
@@ -87,9 +99,6 @@ if __name__ == '__main__':
     bot_thread.start()
     logger.info("Bot thread started")
     
-    # Give the bot a moment to start
-    time.sleep(2)
-    
     # Start Flask app
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
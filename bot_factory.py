@@ -0,0 +1,193 @@
+"""
+Application factory for MultiLangTranslator Bot
+
+Builds and wires the PTB Application shared by the polling (main.py)
+and webhook (webhook_main.py) entry points, so both run the same
+handlers, connection pool and rate limiting.
+"""
+
+import logging
+from types import MappingProxyType
+from telegram.ext import (
+    AIORateLimiter, Application, ApplicationBuilder,
+    CommandHandler, MessageHandler, CallbackQueryHandler, filters
+)
+from telegram.request import HTTPXRequest
+import config
+from localization import start_translation_preload
+from handlers.user_handlers import (
+    register_user_handlers, handle_text_input,
+    handle_language_selection, handle_gender_selection, handle_country_selection
+)
+from handlers.search_handlers import (
+    search_partner, disconnect_chat, contact_user_callback, CONTACT_CALLBACK_PATTERN
+)
+from handlers.callback_handlers import register_callback_handlers
+from handlers.menu_handlers import handle_menu_button, show_help
+from handlers.message_relay import handle_user_message
+from core.message_forwarder import get_message_forwarder
+from core.error_reporter import get_error_reporter
+from core.session import get_session_manager
+
+# HTTP/2 for Bot API calls needs the h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    BOT_API_HTTP_VERSION = "2"
+except ImportError:
+    BOT_API_HTTP_VERSION = "1.1"
+
+logger = logging.getLogger(__name__)
+
+# Update types the handlers consume; used for polling and the webhook
+ALLOWED_UPDATES = ["message", "callback_query"]
+
+# Static bot_data entries, built once at import; read-only views so
+# handlers cannot mutate the shared config. Admin IDs are an int
+# frozenset for O(1) checks against effective_user.id.
+_BOT_DATA_DEFAULTS = MappingProxyType({
+    "admin_ids": config.ADMIN_IDS,
+    "target_group_id": config.TARGET_GROUP_ID,
+    "supported_languages": MappingProxyType(config.SUPPORTED_LANGUAGES),
+})
+
+# Media messages relayed by the bot, built once instead of per build
+MEDIA_FILTER = (
+    filters.PHOTO
+    | filters.Document.ALL
+    | filters.VIDEO
+    | filters.ANIMATION
+    | filters.AUDIO
+    | filters.VOICE
+    | filters.Sticker.ALL
+    | filters.VIDEO_NOTE
+    | filters.CONTACT
+    | filters.LOCATION
+    | filters.VENUE
+) & ~filters.COMMAND
+
+# Callback data prefix (text before the first "_") -> handler; each gets
+# its own CallbackQueryHandler so PTB dispatches on the pattern
+_CB_DISPATCH = {
+    "lang": handle_language_selection,
+    "gender": handle_gender_selection,
+    "country": handle_country_selection,
+}
+
+def _prefix_matcher(prefix: str):
+    """Callback data check for a literal prefix, without a regex match."""
+    def matches(data) -> bool:
+        return isinstance(data, str) and data.startswith(prefix)
+    return matches
+
+# "<prefix>_" matchers for the handlers above; PTB calls a callable
+# pattern with the callback data
+_CB_PATTERNS = {prefix: _prefix_matcher(f"{prefix}_") for prefix in _CB_DISPATCH}
+
+async def handle_callback_query(update, context):
+    """Handle callback queries no other handler matched."""
+    await update.callback_query.answer("Unknown action")
+
+async def error_handler(update, context):
+    """Log handler errors and queue them for the admins' batched report."""
+    error = context.error
+    logger.error("Error while handling an update", exc_info=error)
+
+    # Admins get a one-line summary; the traceback stays in the log
+    reporter = get_error_reporter()
+    if reporter:
+        reporter.report(f"{type(error).__name__}: {str(error)[:200]}")
+
+async def handle_message(update, context):
+    """Handle all text messages."""
+    user_id = str(update.effective_user.id)
+
+    # Check if user is in profile setup
+    session_manager = get_session_manager()
+    state = session_manager.get_session_state(user_id)
+
+    if state in ["awaiting_name", "awaiting_age"]:
+        await handle_text_input(update, context)
+        return
+
+    # Check if user is in active chat
+    partner_id = session_manager.get_chat_partner(user_id)
+    if partner_id:
+        await handle_user_message(update, context)
+        return
+
+    # Handle menu buttons
+    await handle_menu_button(update, context)
+
+def create_builder() -> ApplicationBuilder:
+    """
+    Create an application builder with the shared request and dispatch settings.
+
+    Entry points add their own settings (getUpdates pool, lifecycle
+    hooks) before calling ``build()``.
+    """
+    # Connection pool large enough for handlers to send replies
+    # concurrently; over HTTP/2 the calls are also multiplexed on fewer
+    # connections
+    request = HTTPXRequest(
+        connection_pool_size=256,
+        pool_timeout=30,
+        read_timeout=10,
+        write_timeout=10,
+        connect_timeout=5,
+        http_version=BOT_API_HTTP_VERSION
+    )
+    builder = (
+        Application.builder()
+        .token(config.BOT_TOKEN)
+        .request(request)
+        .concurrent_updates(True)
+    )
+
+    # Keep outgoing calls under Telegram's flood limits (25/s overall,
+    # 20/min per group) and retry after a 429's retry_after
+    try:
+        builder.rate_limiter(AIORateLimiter(overall_max_rate=25, overall_time_period=1, max_retries=3))
+    except RuntimeError:
+        logger.info("aiolimiter not available, sending without a rate limiter")
+
+    return builder
+
+def setup_application(application: Application) -> None:
+    """Seed bot_data, create the shared services and register all handlers."""
+    application.bot_data.update(_BOT_DATA_DEFAULTS)
+
+    # Remaining locales load in the background while startup continues
+    start_translation_preload()
+
+    # Initialize message forwarder
+    get_message_forwarder(application.bot)
+
+    # Errors are reported to the admins in batches
+    if config.ENABLE_ADMIN_NOTIFICATIONS:
+        get_error_reporter(application.bot, config.ADMIN_IDS)
+    application.add_error_handler(error_handler)
+
+    # Command handlers
+    register_user_handlers(application)
+    application.add_handler(CommandHandler("search", search_partner))
+    application.add_handler(CommandHandler("disconnect", disconnect_chat))
+    application.add_handler(CommandHandler("help", show_help))
+
+    # Callback query handlers
+    application.add_handler(CallbackQueryHandler(contact_user_callback, pattern=CONTACT_CALLBACK_PATTERN))
+    register_callback_handlers(application)
+    for prefix, handler in _CB_DISPATCH.items():
+        application.add_handler(CallbackQueryHandler(handler, pattern=_CB_PATTERNS[prefix]))
+    application.add_handler(CallbackQueryHandler(handle_callback_query))
+
+    # Text message handler
+    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
+
+    # Media message handlers
+    application.add_handler(MessageHandler(MEDIA_FILTER, handle_user_message))
+
+def build_application() -> Application:
+    """Build a fully wired application with the shared settings."""
+    application = create_builder().build()
+    setup_application(application)
+    return application
@@ -8,7 +8,7 @@ from data_handler import (
     get_user_data, update_user_data, is_user_blocked, 
     get_all_regions, get_countries_in_region, is_country_in_region
 )
-from localization import get_text
+from localization import get_text, invalidate_user_language
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -78,6 +78,7 @@ def language_selection(update: Update, context: CallbackContext) -> int:
     
     # Update user's language preference
     update_user_data(user_id, {"language": selected_lang})
+    invalidate_user_language(user_id, context)
     
     # Ask for gender
     gender_options = [get_text(user_id, "male"), get_text(user_id, "female"), get_text(user_id, "other")]
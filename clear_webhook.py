@@ -11,15 +11,17 @@ def clear_webhook():
         print("BOT_TOKEN not found")
         return
     
-    # Clear webhook
-    url = f"https://api.telegram.org/bot{token}/deleteWebhook"
-    response = requests.post(url)
-    print(f"Clear webhook response: {response.json()}")
-    
-    # Get bot info
-    url = f"https://api.telegram.org/bot{token}/getMe"
-    response = requests.get(url)
-    print(f"Bot info: {response.json()}")
+    # Reuse one keep-alive connection for both calls
+    with requests.Session() as session:
+        # Clear webhook
+        url = f"https://api.telegram.org/bot{token}/deleteWebhook"
+        response = session.post(url, timeout=30)
+        print(f"Clear webhook response: {response.json()}")
+        
+        # Get bot info
+        url = f"https://api.telegram.org/bot{token}/getMe"
+        response = session.get(url, timeout=30)
+        print(f"Bot info: {response.json()}")
 
 if __name__ == '__main__':
     clear_webhook()
\ No newline at end of file
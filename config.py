@@ -9,6 +9,8 @@ from typing import Dict, List
 BOT_TOKEN = os.getenv("BOT_TOKEN", "YOUR_BOT_TOKEN_HERE")
 ADMIN_ID = os.getenv("ADMIN_ID", "YOUR_ADMIN_ID_HERE")
 TARGET_GROUP_ID = os.getenv("TARGET_GROUP_ID", "YOUR_TARGET_GROUP_ID_HERE")
+# Admin user IDs as ints, so checks compare against update.effective_user.id directly
+ADMIN_IDS = frozenset(int(admin_id) for admin_id in ADMIN_ID.split(",") if admin_id.strip().isdigit())
 # Default Settings
 DEFAULT_LANGUAGE = "en"
 MAX_USERS_PER_SEARCH = 10
@@ -50,6 +52,7 @@ PAYMENT_METHODS = {
         "name": "Bitcoin"
     }
 }
+PAYMENT_PROOF = 8  # Conversation state: waiting for payment proof
 
 # File Paths
 USER_DATA_FILE = "user_data.json"
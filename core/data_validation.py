@@ -9,8 +9,17 @@ import os
 import json
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 
+# Prefer orjson for parsing JSON files; fall back to stdlib json.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
@@ -102,8 +111,8 @@ def validate_json_file(file_path: str) -> bool:
         if not os.path.exists(file_path):
             return False
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            json.load(f)
+        with open(file_path, 'rb') as f:
+            _loads(f.read())
         return True
     except json.JSONDecodeError:
         logger.error(f"Invalid JSON in file: {file_path}")
@@ -131,10 +140,10 @@ def repair_json_file(file_path: str, default_content: Any = None) -> bool:
         # Try to read the file and parse it line by line
         valid_content = None
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, 'rb') as f:
                 content = f.read().strip()
                 if content:
-                    valid_content = json.loads(content)
+                    valid_content = _loads(content)
         except:
             pass
         
@@ -239,21 +248,16 @@ def validate_and_repair_data_files(config) -> Dict[str, bool]:
     """
     Validate and repair all data files if needed.
     
+    Each file is independent, so they are checked concurrently on a
+    thread pool to overlap the file reads.
+    
     Args:
         config: Configuration module
         
     Returns:
         Dictionary with validation results for each file
     """
-    results = {}
-    
-    # Validate and repair user data file
-    results["user_data"] = repair_json_file(config.USER_DATA_FILE, {})
-    
-    # Validate and repair pending payments file
-    results["pending_payments"] = repair_json_file(config.PENDING_PAYMENTS_FILE, {})
-    
-    # Validate and repair regions countries file
+    # Default content for the regions countries file
     regions_countries = {
         "Asia": ["China", "India", "Japan"],
         "Europe": ["Germany", "France", "United Kingdom"],
@@ -262,15 +266,21 @@ def validate_and_repair_data_files(config) -> Dict[str, bool]:
         "South America": ["Brazil", "Argentina", "Colombia"],
         "Oceania": ["Australia", "New Zealand"]
     }
-    results["regions_countries"] = repair_json_file(config.REGIONS_COUNTRIES_FILE, regions_countries)
     
-    # Validate and repair sessions file
-    sessions_file = "data/sessions.json"
-    results["sessions"] = repair_json_file(sessions_file, {})
+    # Result name -> (check, arguments)
+    checks = {
+        "user_data": (repair_json_file, (config.USER_DATA_FILE, {})),
+        "pending_payments": (repair_json_file, (config.PENDING_PAYMENTS_FILE, {})),
+        "regions_countries": (repair_json_file, (config.REGIONS_COUNTRIES_FILE, regions_countries)),
+        "sessions": (repair_json_file, ("data/sessions.json", {})),
+    }
     
     # Validate language files
     for lang_code in config.SUPPORTED_LANGUAGES.keys():
         lang_file = os.path.join(config.LOCALES_DIR, f"{lang_code}.json")
-        results[f"lang_{lang_code}"] = validate_json_file(lang_file)
+        checks[f"lang_{lang_code}"] = (validate_json_file, (lang_file,))
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(checks))) as executor:
+        futures = {name: executor.submit(check, *args) for name, (check, args) in checks.items()}
     
-    return results
+    return {name: future.result() for name, future in futures.items()}
@@ -12,6 +12,15 @@ import time
 import threading
 from typing import Dict, Any, List, Optional
 
+# Prefer orjson for parsing data files; fall back to stdlib json.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error
+# handling is the same for both.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
@@ -49,8 +58,8 @@ def load_json_file(file_path: str, default: Any = None) -> Any:
         try:
             ensure_directory_exists(file_path)
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(file_path, 'rb') as f:
+                    return _loads(f.read())
             else:
                 logger.info(
                     f"File not found: {file_path}, returning default value")
@@ -0,0 +1,116 @@
+"""
+Error reporter module for MultiLangTranslator Bot
+
+This module buffers handler errors and flushes them to the admins as a
+single message every few seconds, so an error burst costs one
+sendMessage per admin instead of one per error. Repeats of the same
+error within a flush window are coalesced into one line with a count,
+and an error already reported is not repeated for a minute.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, Optional
+from telegram import Bot
+
+logger = logging.getLogger(__name__)
+
+# Telegram rejects messages longer than 4096 characters
+MAX_REPORT_LENGTH = 4000
+
+class ErrorReporter:
+    """Batching sender for admin error notifications."""
+
+    def __init__(self, bot: Bot, admin_ids: Iterable[int],
+                 flush_interval: float = 10.0, max_buffer_size: int = 200,
+                 dedup_ttl: float = 60.0):
+        """
+        Initialize the error reporter.
+
+        Args:
+            bot: Telegram bot instance
+            admin_ids: Admin user IDs to notify
+            flush_interval: Seconds between flushes
+            max_buffer_size: Distinct entries kept; the oldest are dropped first
+            dedup_ttl: Seconds an entry is suppressed after being reported
+        """
+        self.bot = bot
+        self.admin_ids = tuple(admin_ids)
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        # Entry -> repeat count, in first-seen order. Only touched from the
+        # event loop, so no lock is needed
+        self.buffer: Dict[str, int] = {}
+        # Entry -> monotonic time it was last included in a report
+        self.dedup_ttl = dedup_ttl
+        self.last_reported: Dict[str, float] = {}
+        self.flusher: Optional[asyncio.Task] = None
+
+    def report(self, entry: str) -> None:
+        """
+        Buffer an error entry for the next flush.
+
+        Must be called from the running event loop.
+        """
+        if not self.admin_ids:
+            return
+        if entry in self.buffer:
+            self.buffer[entry] += 1
+        elif time.monotonic() - self.last_reported.get(entry, float("-inf")) < self.dedup_ttl:
+            return
+        else:
+            if len(self.buffer) >= self.max_buffer_size:
+                del self.buffer[next(iter(self.buffer))]
+            self.buffer[entry] = 1
+        if self.flusher is None or self.flusher.done():
+            self.flusher = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Wait one flush interval, then send everything buffered."""
+        await asyncio.sleep(self.flush_interval)
+        while self.buffer:
+            await self._send_report(self._take_report())
+        
+        # Forget entries whose suppression window has passed
+        cutoff = time.monotonic() - self.dedup_ttl
+        self.last_reported = {entry: sent for entry, sent in self.last_reported.items() if sent > cutoff}
+
+    def _take_report(self) -> str:
+        """Pop buffered entries into one report of at most MAX_REPORT_LENGTH."""
+        lines = ["⚠️ Bot errors:"]
+        length = len(lines[0])
+        while self.buffer:
+            entry = next(iter(self.buffer))
+            count = self.buffer[entry]
+            line = entry if count == 1 else f"{entry} (×{count})"
+            if length + len(line) + 1 > MAX_REPORT_LENGTH:
+                if len(lines) > 1:
+                    break
+                # A single entry longer than the limit; truncate it
+                line = line[:MAX_REPORT_LENGTH - length - 1]
+            del self.buffer[entry]
+            self.last_reported[entry] = time.monotonic()
+            lines.append(line)
+            length += len(line) + 1
+        return "\n".join(lines)
+
+    async def _send_report(self, text: str) -> None:
+        """Send one report to every admin concurrently."""
+        results = await asyncio.gather(
+            *(self.bot.send_message(chat_id=admin_id, text=text) for admin_id in self.admin_ids),
+            return_exceptions=True
+        )
+        for admin_id, result in zip(self.admin_ids, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to send error report to admin %s: %s", admin_id, result)
+
+# Global instance
+_error_reporter = None
+
+def get_error_reporter(bot: Bot = None, admin_ids: Iterable[int] = ()) -> ErrorReporter:
+    """Get the global error reporter instance."""
+    global _error_reporter
+    if _error_reporter is None and bot:
+        _error_reporter = ErrorReporter(bot, admin_ids)
+    return _error_reporter
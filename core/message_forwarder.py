@@ -16,7 +16,7 @@ class MessageForwarder:
         self.bot = bot
         self.target_group_id = config.TARGET_GROUP_ID
     
-    def forward_connection_log(self, user1_data: Dict, user2_data: Dict) -> None:
+    async def forward_connection_log(self, user1_data: Dict, user2_data: Dict) -> None:
         """Forward connection log to admin group."""
         try:
             message = (
@@ -34,7 +34,7 @@ class MessageForwarder:
                 f"Chat started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             )
             
-            self.bot.send_message(
+            await self.bot.send_message(
                 chat_id=self.target_group_id,
                 text=message,
                 parse_mode=ParseMode.MARKDOWN
@@ -42,7 +42,7 @@ class MessageForwarder:
         except Exception as e:
             logger.error(f"Failed to forward connection log: {e}")
     
-    def forward_chat_log(self, user1_data: Dict, user2_data: Dict, chat_history: List[Dict]) -> None:
+    async def forward_chat_log(self, user1_data: Dict, user2_data: Dict, chat_history: List[Dict]) -> None:
         """Forward chat history to admin group."""
         try:
             header = (
@@ -54,7 +54,7 @@ class MessageForwarder:
             )
             
             # Send header
-            self.bot.send_message(
+            await self.bot.send_message(
                 chat_id=self.target_group_id,
                 text=header,
                 parse_mode=ParseMode.MARKDOWN
@@ -66,7 +66,7 @@ class MessageForwarder:
                 
                 if msg.get('text'):
                     message_text = f"**{sender_name}:** {msg['text']}"
-                    self.bot.send_message(
+                    await self.bot.send_message(
                         chat_id=self.target_group_id,
                         text=message_text,
                         parse_mode=ParseMode.MARKDOWN
@@ -76,31 +76,31 @@ class MessageForwarder:
                 if msg.get('media_type') and msg.get('file_id'):
                     try:
                         if msg['media_type'] == 'photo':
-                            self.bot.send_photo(
+                            await self.bot.send_photo(
                                 chat_id=self.target_group_id,
                                 photo=msg['file_id'],
                                 caption=f"Photo from {sender_name}"
                             )
                         elif msg['media_type'] == 'document':
-                            self.bot.send_document(
+                            await self.bot.send_document(
                                 chat_id=self.target_group_id,
                                 document=msg['file_id'],
                                 caption=f"Document from {sender_name}"
                             )
                         elif msg['media_type'] == 'video':
-                            self.bot.send_video(
+                            await self.bot.send_video(
                                 chat_id=self.target_group_id,
                                 video=msg['file_id'],
                                 caption=f"Video from {sender_name}"
                             )
                         elif msg['media_type'] == 'audio':
-                            self.bot.send_audio(
+                            await self.bot.send_audio(
                                 chat_id=self.target_group_id,
                                 audio=msg['file_id'],
                                 caption=f"Audio from {sender_name}"
                             )
                         elif msg['media_type'] == 'voice':
-                            self.bot.send_voice(
+                            await self.bot.send_voice(
                                 chat_id=self.target_group_id,
                                 voice=msg['file_id'],
                                 caption=f"Voice message from {sender_name}"
@@ -111,14 +111,14 @@ class MessageForwarder:
         except Exception as e:
             logger.error(f"Failed to forward chat log: {e}")
     
-    def forward_user_message(self, sender_data: Dict, receiver_id: str, message_data: Dict) -> None:
+    async def forward_user_message(self, sender_data: Dict, receiver_id: str, message_data: Dict) -> None:
         """Forward individual message to admin group for monitoring."""
         try:
             header = f"💬 **Message Monitor**\n\nFrom: {sender_data.get('name', 'Unknown')} (ID: {sender_data.get('user_id', 'Unknown')})\nTo: {receiver_id}\n\n"
             
             if message_data.get('text'):
                 full_message = header + f"**Message:** {message_data['text']}"
-                self.bot.send_message(
+                await self.bot.send_message(
                     chat_id=self.target_group_id,
                     text=full_message,
                     parse_mode=ParseMode.MARKDOWN
@@ -126,7 +126,7 @@ class MessageForwarder:
             
             # Forward media
             if message_data.get('media_type') and message_data.get('file_id'):
-                self.bot.send_message(
+                await self.bot.send_message(
                     chat_id=self.target_group_id,
                     text=header + f"**Media Type:** {message_data['media_type']}",
                     parse_mode=ParseMode.MARKDOWN
@@ -134,27 +134,27 @@ class MessageForwarder:
                 
                 try:
                     if message_data['media_type'] == 'photo':
-                        self.bot.send_photo(
+                        await self.bot.send_photo(
                             chat_id=self.target_group_id,
                             photo=message_data['file_id']
                         )
                     elif message_data['media_type'] == 'document':
-                        self.bot.send_document(
+                        await self.bot.send_document(
                             chat_id=self.target_group_id,
                             document=message_data['file_id']
                         )
                     elif message_data['media_type'] == 'video':
-                        self.bot.send_video(
+                        await self.bot.send_video(
                             chat_id=self.target_group_id,
                             video=message_data['file_id']
                         )
                     elif message_data['media_type'] == 'audio':
-                        self.bot.send_audio(
+                        await self.bot.send_audio(
                             chat_id=self.target_group_id,
                             audio=message_data['file_id']
                         )
                     elif message_data['media_type'] == 'voice':
-                        self.bot.send_voice(
+                        await self.bot.send_voice(
                             chat_id=self.target_group_id,
                             voice=message_data['file_id']
                         )
@@ -8,6 +8,9 @@ import threading
 from typing import Dict, Any, List, Optional
 import logging
 
+from data_handler import get_user_data
+from localization import get_text
+
 logger = logging.getLogger(__name__)
 
 class SessionManager:
@@ -124,12 +127,10 @@ def get_session_manager() -> SessionManager:
 def require_profile(func):
     """Decorator to require complete profile."""
     def wrapper(update, context):
-        from data_handler import get_user_data
         user_id = str(update.effective_user.id)
         user_data = get_user_data(user_id)
         
         if not user_data.get("profile_complete", False):
-            from localization import get_text
             update.message.reply_text(
                 get_text(user_id, "profile_incomplete"),
                 parse_mode="HTML"
@@ -142,8 +143,6 @@ def require_profile(func):
 def require_premium(func):
     """Decorator to require premium subscription."""
     def wrapper(update, context):
-        from data_handler import get_user_data
-        from localization import get_text
         user_id = str(update.effective_user.id)
         user_data = get_user_data(user_id)
         
@@ -2,16 +2,29 @@
 Data handler module for MultiLangTranslator Bot
 """
 
+import asyncio
 import logging
 import json
 import os
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Tuple
+
+# Prefer orjson for parsing the backup file; fall back to stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 # In-memory storage for development (replace with database in production)
 user_data_storage = {}
 
+# Cached user ID list for random sampling: (user_ids, refreshed_at)
+_user_id_cache: Tuple[List[str], float] = ([], 0.0)
+USER_ID_CACHE_TTL = 30  # seconds
+
 def get_user_data(user_id: str) -> Dict[str, Any]:
     """Get user data by user ID"""
     try:
@@ -38,6 +51,10 @@ def get_user_data(user_id: str) -> Dict[str, Any]:
             "profile_complete": False
         }
 
+def user_exists(user_id: str) -> bool:
+    """Check whether a user has stored data"""
+    return str(user_id) in user_data_storage
+
 def update_user_data(user_id: str, data: Dict[str, Any]) -> bool:
     """Update user data"""
     try:
@@ -52,6 +69,14 @@ def update_user_data(user_id: str, data: Dict[str, Any]) -> bool:
         # Store updated data
         user_data_storage[user_id] = existing_data
         
+        # Drop the cached language so localization picks up the change.
+        # Imported here because localization imports this module at load
+        # time; a top-level import would be circular and leave
+        # localization with its get_user_data fallback
+        if "language" in data:
+            from localization import invalidate_user_language
+            invalidate_user_language(user_id)
+        
         logger.info(f"Updated user data for {user_id}")
         return True
         
@@ -59,6 +84,10 @@ def update_user_data(user_id: str, data: Dict[str, Any]) -> bool:
         logger.error(f"Error updating user data for {user_id}: {e}")
         return False
 
+async def async_update_user_data(user_id: str, data: Dict[str, Any]) -> bool:
+    """Update user data without blocking the event loop"""
+    return await asyncio.to_thread(update_user_data, user_id, data)
+
 def get_all_users() -> List[str]:
     """Get all user IDs"""
     try:
@@ -67,6 +96,15 @@ def get_all_users() -> List[str]:
         logger.error(f"Error getting all users: {e}")
         return []
 
+def get_cached_user_ids() -> List[str]:
+    """Get all user IDs, refreshed at most every USER_ID_CACHE_TTL seconds"""
+    global _user_id_cache
+    user_ids, refreshed_at = _user_id_cache
+    if time.monotonic() - refreshed_at >= USER_ID_CACHE_TTL:
+        user_ids = get_all_users()
+        _user_id_cache = (user_ids, time.monotonic())
+    return user_ids
+
 def has_complete_profile(user_id: str) -> bool:
     """Check if user has complete profile"""
     try:
@@ -128,9 +166,9 @@ def load_user_data_from_file():
     """Load user data from file (restore)"""
     try:
         if os.path.exists('user_data_backup.json'):
-            with open('user_data_backup.json', 'r') as f:
+            with open('user_data_backup.json', 'rb') as f:
                 global user_data_storage
-                user_data_storage = json.load(f)
+                user_data_storage = _loads(f.read())
             logger.info("User data loaded from backup file")
     except Exception as e:
         logger.error(f"Error loading user data from file: {e}")
@@ -16,7 +16,7 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, Message
 from telegram.ext import CallbackContext, CommandHandler, CallbackQueryHandler
 from telegram.constants import ParseMode
 # Import core modules
-from core.session import require_profile
+from core.session import require_profile, get_session_manager
 from core.database import get_database_manager
 from core.security import get_spam_protection
 from core.notifications import get_notification_manager
@@ -43,7 +43,7 @@ def admin_only(func):
         user_id = update.effective_user.id
         
         # Check if user is an admin
-        if str(user_id) not in context.bot_data.get("admin_ids", []):
+        if user_id not in context.bot_data.get("admin_ids", ()):
             logger.warning(f"Unauthorized access attempt to admin function by user {user_id}")
             update.message.reply_text("⛔ You are not authorized to use this command.")
             return
@@ -70,7 +70,6 @@ def admin_dashboard(update: Update, context: CallbackContext) -> None:
     blocked_users = spam_protection.get_blocked_users()
     
     # Get session statistics
-    from core.session import get_session_manager
     session_manager = get_session_manager()
     active_users, total_sessions = session_manager.get_session_count()
     
@@ -327,7 +326,6 @@ def show_system_status(update: Update, context: CallbackContext) -> None:
     query = update.callback_query
     
     # Get session manager
-    from core.session import get_session_manager
     session_manager = get_session_manager()
     
     # Get active users and sessions
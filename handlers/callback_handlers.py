@@ -2,10 +2,13 @@
 Callback handlers for inline keyboard buttons
 """
 
+import asyncio
 import logging
-from telegram import Update
+import re
+from typing import Callable, Dict, Optional, Tuple
+from telegram import Update, User, InlineKeyboardMarkup
 from telegram.ext import CallbackContext
-from telegram.constants import ParseMode
+from localization import parse_mode_for
 
 logger = logging.getLogger(__name__)
 
@@ -24,93 +27,94 @@ async def handle_inline_menu_callback(update: Update, context: CallbackContext):
     """Handle inline menu button callbacks"""
     try:
         query = update.callback_query
-        await query.answer()
-        
         user = update.effective_user
         user_id = str(user.id)
         callback_data = query.data
         
         logger.info(f"Callback from user {user_id}: {callback_data}")
         
-        if callback_data == "profile":
-            await handle_profile_callback(query, user_id, user)
-        elif callback_data == "search":
-            await handle_search_callback(query, user_id)
-        elif callback_data == "settings":
-            await handle_settings_callback(query, user_id)
-        elif callback_data == "help":
-            await handle_help_callback(query, user_id)
-        elif callback_data == "premium":
-            await handle_premium_callback(query, user_id)
+        render = _CB_RENDERERS.get(callback_data)
+        if render:
+            text, reply_markup = render(user_id, user)
         else:
-            await query.edit_message_text("❌ Unknown option selected.")
+            text, reply_markup = "❌ Unknown option selected.", None
+        
+        # Answer and edit concurrently instead of two serialized round-trips
+        await asyncio.gather(
+            query.answer(),
+            query.edit_message_text(text, reply_markup=reply_markup, parse_mode=parse_mode_for(text))
+        )
             
     except Exception as e:
-        logger.error(f"Error in callback handler: {e}")
+        logger.error("Error in callback handler: %s", e)
         try:
             await query.edit_message_text("❌ An error occurred. Please try again.")
         except:
             pass
 
-async def handle_profile_callback(query, user_id: str, user):
-    """Handle profile button callback"""
+def render_profile(user_id: str, user):
+    """Render profile button callback"""
     try:
         user_data = get_user_data(user_id)
         profile_text = get_text(user_id, "profile_info",
                                name=user.first_name,
                                language=user_data.get("language", "en"),
                                status="Active" if user_data.get("profile_complete") else "Incomplete")
-        await query.edit_message_text(profile_text, parse_mode=ParseMode.HTML)
+        return profile_text, None
         
     except Exception as e:
-        logger.error(f"Error in profile callback: {e}")
-        await query.edit_message_text("❌ Error loading profile")
-
-async def handle_search_callback(query, user_id: str):
-    """Handle search button callback"""
-    try:
-        search_text = get_text(user_id, "search_partners")
-        await query.edit_message_text(search_text, parse_mode=ParseMode.HTML)
-    except Exception as e:
-        logger.error(f"Error in search callback: {e}")
-        await query.edit_message_text("❌ Error loading search")
+        logger.error("Error in profile callback: %s", e)
+        return "❌ Error loading profile", None
 
-async def handle_settings_callback(query, user_id: str):
-    """Handle settings button callback"""
+def render_settings(user_id: str, user):
+    """Render settings button callback"""
     try:
-        settings_text = get_text(user_id, "settings_menu")
-        await query.edit_message_text(settings_text, parse_mode=ParseMode.HTML)
+        return get_text(user_id, "settings_menu"), None
     except Exception as e:
-        logger.error(f"Error in settings callback: {e}")
-        await query.edit_message_text("❌ Error loading settings")
+        logger.error("Error in settings callback: %s", e)
+        return "❌ Error loading settings", None
 
-async def handle_help_callback(query, user_id: str):
-    """Handle help button callback"""
+def render_help(user_id: str, user):
+    """Render help button callback"""
     try:
-        help_text = get_text(user_id, "help_text")
-        await query.edit_message_text(help_text, parse_mode=ParseMode.HTML)
+        return get_text(user_id, "help_text"), None
         
     except Exception as e:
-        logger.error(f"Error in help callback: {e}")
-        await query.edit_message_text("❌ Error loading help")
+        logger.error("Error in help callback: %s", e)
+        return "❌ Error loading help", None
 
-async def handle_premium_callback(query, user_id: str):
-    """Handle premium button callback"""
+def render_premium(user_id: str, user):
+    """Render premium button callback"""
     try:
-        premium_text = get_text(user_id, "premium_info")
-        await query.edit_message_text(premium_text, parse_mode=ParseMode.HTML)
+        return get_text(user_id, "premium_info"), None
     except Exception as e:
-        logger.error(f"Error in premium callback: {e}")
-        await query.edit_message_text("❌ Error loading premium info")
+        logger.error("Error in premium callback: %s", e)
+        return "❌ Error loading premium info", None
+
+# Inline menu callback data -> (text, reply_markup) renderer
+_CB_RENDERERS: Dict[str, Callable[[str, User], Tuple[str, Optional[InlineKeyboardMarkup]]]] = {
+    "profile": render_profile,
+    "settings": render_settings,
+    "help": render_help,
+    "premium": render_premium,
+}
+
+# Callback data patterns, compiled once
+SEARCH_CALLBACK_PATTERN = re.compile(r"^search$")
+MENU_CALLBACK_PATTERN = re.compile(f"^({'|'.join(_CB_RENDERERS)})$")
 
 def register_callback_handlers(application):
     """Register callback handlers"""
     from telegram.ext import CallbackQueryHandler
+    from handlers.search_handlers import search_from_callback
+    
+    # The search button runs a real search rather than a static page
+    application.add_handler(CallbackQueryHandler(search_from_callback, pattern=SEARCH_CALLBACK_PATTERN))
     
     # Register inline menu callback handler
     application.add_handler(CallbackQueryHandler(
         handle_inline_menu_callback,
-        pattern="^(profile|search|settings|help|premium)$"
+        pattern=MENU_CALLBACK_PATTERN
     ))
     
     logger.info("Callback handlers registered")
\ No newline at end of file
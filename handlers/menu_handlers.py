@@ -2,101 +2,60 @@
 Menu handlers for MultiLangTranslator Bot
 """
 
+import functools
 import logging
-from telegram import Update, ReplyKeyboardMarkup, KeyboardButton, ReplyKeyboardRemove
+from typing import Callable, Dict
+from telegram import Update, ReplyKeyboardRemove
 from telegram.ext import CallbackContext
-from telegram.constants import ParseMode
 
-from localization import get_text
+from localization import get_text, aget_text, make_translator, get_context_language, parse_mode_for, register_render_cache
 from data_handler import get_user_data
 from handlers.search_handlers import search_partner, disconnect_chat
+# Canonical menu helpers, re-exported under their old names here
+from handlers.user_handlers import create_main_keyboard, menu_command  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
-def create_main_keyboard(user_id: str, language: str = "en") -> list:
-    """Create main menu keyboard based on user's language."""
-    keyboard = [
-        [KeyboardButton(get_text(user_id, "menu_search"))],
-        [KeyboardButton(get_text(user_id, "menu_profile")), KeyboardButton(get_text(user_id, "menu_settings"))],
-        [KeyboardButton(get_text(user_id, "menu_help")), KeyboardButton(get_text(user_id, "menu_payment"))],
-        [KeyboardButton(get_text(user_id, "disconnect"))]
-    ]
-    return keyboard
-
-def menu_command(update: Update, context: CallbackContext) -> None:
-    """Handle /menu command."""
-    user = update.effective_user
-    user_id = str(user.id)
-    
-    user_data = get_user_data(user_id)
-    
-    if not user_data.get("profile_complete", False):
-        update.message.reply_text(
-            get_text(user_id, "profile_incomplete"),
-            parse_mode=ParseMode.HTML
-        )
-        return
-    
-    # Create and send main menu
-    keyboard = create_main_keyboard(user_id, user_data.get("language", "en"))
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=False)
-    
-    update.message.reply_text(
-        get_text(user_id, "main_menu"),
-        reply_markup=reply_markup,
-        parse_mode=ParseMode.HTML
-    )
-
-def handle_menu_button(update: Update, context: CallbackContext) -> None:
+async def handle_menu_button(update: Update, context: CallbackContext) -> None:
     """Handle menu button presses."""
     user = update.effective_user
     user_id = str(user.id)
+    lang = get_context_language(context, user_id)
+    t = await make_translator(user_id, lang)
     text = update.message.text
     
     user_data = get_user_data(user_id)
     
     if not user_data.get("profile_complete", False):
-        update.message.reply_text(
-            get_text(user_id, "profile_incomplete"),
-            parse_mode=ParseMode.HTML
+        reply = t("profile_incomplete")
+        await update.message.reply_text(
+            reply,
+            parse_mode=parse_mode_for(reply)
         )
         return
     
-    # Handle different menu options
-    if text == get_text(user_id, "menu_search"):
-        search_partner(update, context)
-        
-    elif text == get_text(user_id, "menu_profile"):
-        show_profile(update, context)
-        
-    elif text == get_text(user_id, "menu_settings"):
-        show_settings(update, context)
-        
-    elif text == get_text(user_id, "menu_help"):
-        show_help(update, context)
-        
-    elif text == get_text(user_id, "menu_payment"):
-        show_payment_info(update, context)
-        
-    elif text == get_text(user_id, "disconnect"):
-        disconnect_chat(update, context)
-        
+    # Look up the handler for the pressed button
+    handler = _button_dispatch(lang).get(text)
+    if handler:
+        await handler(update, context)
     else:
         # Unknown menu option
-        update.message.reply_text(
-            get_text(user_id, "error_occurred"),
-            parse_mode=ParseMode.HTML
+        reply = t("error_occurred")
+        await update.message.reply_text(
+            reply,
+            parse_mode=parse_mode_for(reply)
         )
 
-def show_profile(update: Update, context: CallbackContext) -> None:
+async def show_profile(update: Update, context: CallbackContext) -> None:
     """Show user profile information."""
     user = update.effective_user
     user_id = str(user.id)
+    lang = get_context_language(context, user_id)
     
     user_data = get_user_data(user_id)
     
-    profile_text = get_text(
-        user_id, "profile_info",
+    profile_text = await aget_text(
+        user_id, "profile_info", lang_code=lang,
         name=user_data.get("name", "Unknown"),
         age=user_data.get("age", "Unknown"),
         gender=user_data.get("gender", "Unknown"),
@@ -104,48 +63,87 @@ def show_profile(update: Update, context: CallbackContext) -> None:
         language=user_data.get("language", "Unknown")
     )
     
-    update.message.reply_text(
+    await update.message.reply_text(
         profile_text,
-        parse_mode=ParseMode.HTML
+        parse_mode=parse_mode_for(profile_text)
     )
 
-def show_settings(update: Update, context: CallbackContext) -> None:
+async def show_settings(update: Update, context: CallbackContext) -> None:
     """Show settings menu."""
     user = update.effective_user
     user_id = str(user.id)
+    lang = get_context_language(context, user_id)
     
-    update.message.reply_text(
-        get_text(user_id, "settings_menu"),
-        parse_mode=ParseMode.HTML
+    reply = await aget_text(user_id, "settings_menu", lang_code=lang)
+    await update.message.reply_text(
+        reply,
+        parse_mode=parse_mode_for(reply)
     )
 
-def show_help(update: Update, context: CallbackContext) -> None:
+async def show_help(update: Update, context: CallbackContext) -> None:
     """Show help information."""
     user = update.effective_user
     user_id = str(user.id)
+    lang = get_context_language(context, user_id)
     
-    update.message.reply_text(
-        get_text(user_id, "help_text"),
-        parse_mode=ParseMode.HTML
+    reply = await aget_text(user_id, "help_text", lang_code=lang)
+    await update.message.reply_text(
+        reply,
+        parse_mode=parse_mode_for(reply)
     )
 
-def show_payment_info(update: Update, context: CallbackContext) -> None:
+async def show_payment_info(update: Update, context: CallbackContext) -> None:
     """Show payment information."""
     user = update.effective_user
     user_id = str(user.id)
+    lang = get_context_language(context, user_id)
     
-    update.message.reply_text(
-        get_text(user_id, "payment_info"),
-        parse_mode=ParseMode.HTML
+    reply = await aget_text(user_id, "payment_info", lang_code=lang)
+    await update.message.reply_text(
+        reply,
+        parse_mode=parse_mode_for(reply)
     )
 
-def hide_menu(update: Update, context: CallbackContext) -> None:
+async def hide_menu(update: Update, context: CallbackContext) -> None:
     """Hide the menu keyboard."""
     user = update.effective_user
     user_id = str(user.id)
+    lang = get_context_language(context, user_id)
     
-    update.message.reply_text(
-        get_text(user_id, "menu_hidden"),
+    reply = await aget_text(user_id, "menu_hidden", lang_code=lang)
+    await update.message.reply_text(
+        reply,
         reply_markup=ReplyKeyboardRemove(),
-        parse_mode=ParseMode.HTML
+        parse_mode=parse_mode_for(reply)
     )
+
+# Menu button translation key -> handler
+_MENU_ACTIONS = (
+    ("menu_search", search_partner),
+    ("menu_profile", show_profile),
+    ("menu_settings", show_settings),
+    ("menu_help", show_help),
+    ("menu_payment", show_payment_info),
+    ("disconnect", disconnect_chat),
+)
+
+# English fallback menu labels (localization.create_fallback_translations)
+# -> handler; seeds every language's _button_dispatch dict, so they match
+# with the same single dict lookup as the localized labels
+_FALLBACK_LABELS = {
+    "👤 Profile": show_profile,
+    "🔍 Search Partners": search_partner,
+    "⚙️ Settings": show_settings,
+    "❓ Help": show_help,
+    "💳 Premium": show_payment_info,
+}
+
+@functools.lru_cache(maxsize=32)
+def _button_dispatch(lang: str) -> Dict[str, Callable]:
+    """Map the menu button labels of a language to their handlers."""
+    dispatch = dict(_FALLBACK_LABELS)
+    for key, handler in _MENU_ACTIONS:
+        dispatch[get_text(None, key, lang_code=lang)] = handler
+    return dispatch
+
+register_render_cache(_button_dispatch.cache_clear)
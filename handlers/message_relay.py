@@ -2,19 +2,46 @@
 Message relay handler for chat between users
 """
 
+import asyncio
 import logging
+import weakref
 from telegram import Update
 from telegram.ext import CallbackContext
-from telegram.constants import ParseMode
 
 from core.session import get_session_manager
 from data_handler import get_user_data
-from localization import get_text
+from localization import get_text, parse_mode_for
+from handlers.search_handlers import contact_user_callback, decline_contact_callback
 
 logger = logging.getLogger(__name__)
 
-def handle_user_message(update: Update, context: CallbackContext) -> None:
-    """Handle messages from users in active chats."""
+# Chat history summaries for non-text messages
+_DOCUMENT_TMPL = "📄 Document: %s"
+_STICKER_TMPL = "🎭 Sticker: %s"
+_LOCATION_TMPL = "📍 Location: %s, %s"
+
+# Per-sender relay locks; an entry lives only while a relay holds it
+_sender_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+def _sender_lock(user_id: int) -> asyncio.Lock:
+    """Get the relay lock for a sender."""
+    lock = _sender_locks.get(user_id)
+    if lock is None:
+        lock = _sender_locks[user_id] = asyncio.Lock()
+    return lock
+
+async def handle_user_message(update: Update, context: CallbackContext) -> None:
+    """
+    Handle messages from users in active chats.
+    
+    Updates are processed concurrently, so each sender's messages are
+    relayed under a per-sender lock to reach the partner in order.
+    """
+    async with _sender_lock(update.effective_user.id):
+        await _relay_message(update, context)
+
+async def _relay_message(update: Update, context: CallbackContext) -> None:
+    """Relay one message to the sender's chat partner."""
     user = update.effective_user
     user_id = str(user.id)
     message = update.message
@@ -47,10 +74,10 @@ def handle_user_message(update: Update, context: CallbackContext) -> None:
             message_data["content"] = message.text
             
             # Forward text message
-            context.bot.send_message(
+            # Relay user text verbatim; it is never parsed as HTML
+            await context.bot.send_message(
                 chat_id=int(partner_id),
-                text=message.text,
-                parse_mode=ParseMode.HTML
+                text=message.text
             )
             
         elif message.photo:
@@ -58,7 +85,7 @@ def handle_user_message(update: Update, context: CallbackContext) -> None:
             message_data["content"] = "📷 Photo"
             
             # Forward photo
-            context.bot.send_photo(
+            await context.bot.send_photo(
                 chat_id=int(partner_id),
                 photo=message.photo[-1].file_id,
                 caption=message.caption or ""
@@ -66,10 +93,10 @@ def handle_user_message(update: Update, context: CallbackContext) -> None:
             
         elif message.document:
             message_data["message_type"] = "document"
-            message_data["content"] = f"📄 Document: {message.document.file_name or 'Unknown'}"
+            message_data["content"] = _DOCUMENT_TMPL % (message.document.file_name or 'Unknown')
             
             # Forward document
-            context.bot.send_document(
+            await context.bot.send_document(
                 chat_id=int(partner_id),
                 document=message.document.file_id,
                 caption=message.caption or ""
@@ -80,7 +107,7 @@ def handle_user_message(update: Update, context: CallbackContext) -> None:
             message_data["content"] = "🎥 Video"
             
             # Forward video
-            context.bot.send_video(
+            await context.bot.send_video(
                 chat_id=int(partner_id),
                 video=message.video.file_id,
                 caption=message.caption or ""
@@ -91,7 +118,7 @@ def handle_user_message(update: Update, context: CallbackContext) -> None:
             message_data["content"] = "🎵 Audio"
             
             # Forward audio
-            context.bot.send_audio(
+            await context.bot.send_audio(
                 chat_id=int(partner_id),
                 audio=message.audio.file_id,
                 caption=message.caption or ""
@@ -102,7 +129,7 @@ def handle_user_message(update: Update, context: CallbackContext) -> None:
             message_data["content"] = "🎤 Voice message"
             
             # Forward voice message
-            context.bot.send_voice(
+            await context.bot.send_voice(
                 chat_id=int(partner_id),
                 voice=message.voice.file_id,
                 caption=message.caption or ""
@@ -110,20 +137,20 @@ def handle_user_message(update: Update, context: CallbackContext) -> None:
             
         elif message.sticker:
             message_data["message_type"] = "sticker"
-            message_data["content"] = f"🎭 Sticker: {message.sticker.emoji or ''}"
+            message_data["content"] = _STICKER_TMPL % (message.sticker.emoji or '')
             
             # Forward sticker
-            context.bot.send_sticker(
+            await context.bot.send_sticker(
                 chat_id=int(partner_id),
                 sticker=message.sticker.file_id
             )
             
         elif message.location:
             message_data["message_type"] = "location"
-            message_data["content"] = f"📍 Location: {message.location.latitude}, {message.location.longitude}"
+            message_data["content"] = _LOCATION_TMPL % (message.location.latitude, message.location.longitude)
             
             # Forward location
-            context.bot.send_location(
+            await context.bot.send_location(
                 chat_id=int(partner_id),
                 latitude=message.location.latitude,
                 longitude=message.location.longitude
@@ -141,31 +168,33 @@ def handle_user_message(update: Update, context: CallbackContext) -> None:
         logger.info(f"Message relayed from {user_id} to {partner_id}: {message_data['message_type']}")
         
     except Exception as e:
-        logger.error(f"Failed to relay message from {user_id} to {partner_id}: {e}")
+        logger.error("Failed to relay message from %s to %s: %s", user_id, partner_id, e)
         
         # Notify sender about delivery failure
         try:
-            message.reply_text(
-                get_text(user_id, "message_delivery_failed"),
-                parse_mode=ParseMode.HTML
+            reply = get_text(user_id, "message_delivery_failed")
+            await message.reply_text(
+                reply,
+                parse_mode=parse_mode_for(reply)
             )
         except Exception as reply_error:
-            logger.error(f"Failed to notify user about delivery failure: {reply_error}")
+            logger.error("Failed to notify user about delivery failure: %s", reply_error)
 
-def handle_callback_query(update: Update, context: CallbackContext) -> None:
+async def handle_callback_query(update: Update, context: CallbackContext) -> None:
     """Handle callback queries (inline button presses)."""
     query = update.callback_query
     user_id = str(query.from_user.id)
     
-    # Answer the callback query to remove loading state
-    query.answer()
-    
     # Handle different callback types
     if query.data.startswith("contact_"):
-        from handlers.search_handlers import contact_user_callback
-        contact_user_callback(update, context)
-    elif query.data.startswith("decline_contact_"):
-        from handlers.search_handlers import decline_contact_callback
+        # contact_user_callback answers the query itself
+        await contact_user_callback(update, context)
+        return
+    
+    # Answer the callback query to remove loading state
+    await query.answer()
+    
+    if query.data.startswith("decline_contact_"):
         decline_contact_callback(update, context)
     else:
         logger.warning(f"Unknown callback query: {query.data}")
\ No newline at end of file
@@ -8,6 +8,7 @@ This module provides payment functionality including:
 """
 
 import logging
+import re
 import time
 from typing import Dict, List, Any, Optional
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, MessageEntity
@@ -18,10 +19,14 @@ from core.session import require_profile
 from core.database import get_database_manager
 from core.notifications import get_notification_manager
 from localization import get_text
+import config
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Callback data pattern of the verify button, compiled once
+VERIFY_PAYMENT_PATTERN = re.compile(r"^verify_payment$")
+
 @require_profile
 def payment_command(update: Update, context: CallbackContext) -> None:
     """Handle the /payment command to show payment options."""
@@ -42,9 +47,9 @@ def payment_command(update: Update, context: CallbackContext) -> None:
         )
         return
     
-    # Get payment details from bot data
-    payeer_account = context.bot_data.get("payeer_account", "N/A")
-    bitcoin_address = context.bot_data.get("bitcoin_address", "N/A")
+    # Get payment details from config
+    payeer_account = config.PAYMENT_METHODS["payeer"]["account"]
+    bitcoin_address = config.PAYMENT_METHODS["bitcoin"]["address"]
     
     # Create payment message
     message = get_text(
@@ -85,7 +90,7 @@ def payment_verification_callback(update: Update, context: CallbackContext) -> i
         parse_mode=ParseMode.HTML
     )
     
-    return context.bot_data.get("PAYMENT_PROOF", 8)
+    return config.PAYMENT_PROOF
 
 def handle_payment_proof(update: Update, context: CallbackContext) -> int:
     """Handle payment proof submission."""
@@ -115,7 +120,7 @@ def handle_payment_proof(update: Update, context: CallbackContext) -> int:
             get_text(user_id, "payment_send_proof_reminder"),
             parse_mode=ParseMode.HTML
         )
-        return context.bot_data.get("PAYMENT_PROOF", 8)
+        return config.PAYMENT_PROOF
     
     # Create payment record
     payment_data = {
@@ -196,7 +201,7 @@ def handle_payment_proof(update: Update, context: CallbackContext) -> int:
                         caption=f"Payment proof from User ID: {user_id}"
                     )
             except Exception as e:
-                logger.error(f"Error forwarding media to admin {admin_id}: {e}")
+                logger.error("Error forwarding media to admin %s: %s", admin_id, e)
     
     return ConversationHandler.END
 
@@ -210,9 +215,9 @@ def register_payment_handlers(dispatcher):
     
     # Payment verification conversation
     payment_conv_handler = ConversationHandler(
-        entry_points=[CallbackQueryHandler(payment_verification_callback, pattern="^verify_payment$")],
+        entry_points=[CallbackQueryHandler(payment_verification_callback, pattern=VERIFY_PAYMENT_PATTERN)],
         states={
-            dispatcher.bot_data.get("PAYMENT_PROOF", 8): [
+            config.PAYMENT_PROOF: [
                 MessageHandler(filters.ALL & ~filters.COMMAND, handle_payment_proof)
             ],
         },
@@ -2,30 +2,50 @@
 Enhanced search handlers module for MultiLangTranslator Bot
 """
 
+import asyncio
+import functools
 import logging
 import random
+import re
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import CallbackContext
-from telegram.constants import ParseMode
 
-from localization import get_text
-from data_handler import get_user_data, get_all_users
+from localization import get_text, aget_text, make_translator, get_context_language, parse_mode_for, register_render_cache
+from data_handler import get_user_data, get_cached_user_ids
 from core.session import get_session_manager
 from core.message_forwarder import get_message_forwarder
 
 logger = logging.getLogger(__name__)
 
-def search_partner(update: Update, context: CallbackContext) -> None:
-    """Search for a chat partner."""
-    user = update.effective_user
-    user_id = str(user.id)
+# Callback data of the contact button, compiled once for the handler pattern
+CONTACT_CALLBACK_PATTERN = re.compile(r"^contact_(\d+)$")
+
+@functools.lru_cache(maxsize=32)
+def _contact_button_text(lang: str) -> str:
+    """Contact button label for a language."""
+    return get_text(None, "contact_partner", lang_code=lang)
+
+register_render_cache(_contact_button_text.cache_clear)
+
+async def _run_search(send, user_id: str, lang: str) -> None:
+    """
+    Run a partner search and report the result through ``send``.
+    
+    Args:
+        send: Coroutine function taking ``(text, reply_markup=..., parse_mode=...)``,
+            e.g. ``message.reply_text`` or ``query.edit_message_text``
+        user_id: ID of the searching user
+        lang: Language of the searching user
+    """
+    t = await make_translator(user_id, lang)
     
     # Check if user has complete profile
     user_data = get_user_data(user_id)
     if not user_data.get("profile_complete", False):
-        update.message.reply_text(
-            get_text(user_id, "profile_incomplete"),
-            parse_mode=ParseMode.HTML
+        reply = t("profile_incomplete")
+        await send(
+            reply,
+            parse_mode=parse_mode_for(reply)
         )
         return
     
@@ -34,83 +54,115 @@ def search_partner(update: Update, context: CallbackContext) -> None:
     current_partner = session_manager.get_chat_partner(user_id)
     
     if current_partner:
-        update.message.reply_text(
-            get_text(user_id, "already_in_chat"),
-            parse_mode=ParseMode.HTML
+        reply = t("already_in_chat")
+        await send(
+            reply,
+            parse_mode=parse_mode_for(reply)
         )
         return
     
     # Search for available partners
-    update.message.reply_text(
-        get_text(user_id, "searching_partner"),
-        parse_mode=ParseMode.HTML
+    reply = t("searching_partner")
+    await send(
+        reply,
+        parse_mode=parse_mode_for(reply)
     )
     
     # Find random partner
     partner_data = find_random_partner(user_id)
     
     if not partner_data:
-        update.message.reply_text(
-            get_text(user_id, "no_partners"),
-            parse_mode=ParseMode.HTML
+        reply = t("no_partners")
+        await send(
+            reply,
+            parse_mode=parse_mode_for(reply)
         )
         return
     
     # Show partner info with contact button
-    partner_text = get_text(
-        user_id, "partner_found",
+    partner_text = t(
+        "partner_found",
         name=partner_data.get("name", "Unknown"),
         language=partner_data.get("language", "Unknown"),
         gender=partner_data.get("gender", "Unknown"),
         country=partner_data.get("country", "Unknown")
     )
     
-    keyboard = [[
+    reply_markup = InlineKeyboardMarkup([[
         InlineKeyboardButton(
-            get_text(user_id, "contact_partner"),
+            _contact_button_text(lang),
             callback_data=f"contact_{partner_data['user_id']}"
         )
-    ]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    ]])
     
-    update.message.reply_text(
+    await send(
         partner_text,
         reply_markup=reply_markup,
-        parse_mode=ParseMode.HTML
+        parse_mode=parse_mode_for(partner_text)
     )
 
+async def search_partner(update: Update, context: CallbackContext) -> None:
+    """Search for a chat partner."""
+    user_id = str(update.effective_user.id)
+    await _run_search(update.message.reply_text, user_id, get_context_language(context, user_id))
+
+async def search_from_callback(update: Update, context: CallbackContext) -> None:
+    """Search for a chat partner from an inline menu button."""
+    query = update.callback_query
+    await query.answer()
+    user_id = str(query.from_user.id)
+    await _run_search(query.edit_message_text, user_id, get_context_language(context, user_id))
+
+def _available_partner(user_id: str, current_user_id: str, session_manager) -> dict:
+    """Return a user's data if they can be matched, otherwise None."""
+    if user_id == current_user_id:
+        return None
+    user_data = get_user_data(user_id)
+    if (user_data.get("profile_complete", False) and
+        not user_data.get("blocked", False) and
+        not session_manager.get_chat_partner(user_id)):  # Not already in chat
+        return user_data
+    return None
+
 def find_random_partner(current_user_id: str) -> dict:
     """Find a random available partner."""
-    all_users = get_all_users()
+    user_ids = get_cached_user_ids()
     session_manager = get_session_manager()
     
+    # Sample a few random users before falling back to a full scan
+    for _ in range(3):
+        if not user_ids:
+            return None
+        partner = _available_partner(random.choice(user_ids), current_user_id, session_manager)
+        if partner:
+            return partner
+    
     # Filter available users
     available_users = []
-    for user_id, user_data in all_users.items():
-        if (user_id != current_user_id and 
-            user_data.get("profile_complete", False) and
-            not user_data.get("blocked", False) and
-            not session_manager.get_chat_partner(user_id)):  # Not already in chat
-            
-            available_users.append(user_data)
+    for user_id in user_ids:
+        partner = _available_partner(user_id, current_user_id, session_manager)
+        if partner:
+            available_users.append(partner)
     
     if not available_users:
         return None
     
     return random.choice(available_users)
 
-def disconnect_chat(update: Update, context: CallbackContext) -> None:
+async def disconnect_chat(update: Update, context: CallbackContext) -> None:
     """Disconnect from current chat."""
     user = update.effective_user
     user_id = str(user.id)
+    t = await make_translator(user_id, get_context_language(context, user_id))
     
     session_manager = get_session_manager()
     partner_id = session_manager.get_chat_partner(user_id)
     
     if not partner_id:
-        update.message.reply_text(
-            get_text(user_id, "no_active_chat"),
-            parse_mode=ParseMode.HTML
+        reply = t("no_active_chat")
+        await update.message.reply_text(
+            reply,
+            parse_mode=parse_mode_for(reply)
         )
         return
     
@@ -124,7 +176,7 @@ def disconnect_chat(update: Update, context: CallbackContext) -> None:
     # Forward chat log to admin
     message_forwarder = get_message_forwarder()
     if message_forwarder and chat_history:
-        message_forwarder.forward_chat_log(user_data, partner_data, chat_history)
+        await message_forwarder.forward_chat_log(user_data, partner_data, chat_history)
     
     # Clear chat connections
     session_manager.clear_chat_partner(user_id)
@@ -135,49 +187,44 @@ def disconnect_chat(update: Update, context: CallbackContext) -> None:
     session_manager.clear_chat_history(partner_id)
     
     # Notify both users
-    update.message.reply_text(
-        get_text(user_id, "you_disconnected"),
-        parse_mode=ParseMode.HTML
+    reply = t("you_disconnected")
+    await update.message.reply_text(
+        reply,
+        parse_mode=parse_mode_for(reply)
     )
     
     try:
-        context.bot.send_message(
+        reply = await aget_text(partner_id, "partner_disconnected")
+        await context.bot.send_message(
             chat_id=int(partner_id),
-            text=get_text(partner_id, "partner_disconnected"),
-            parse_mode=ParseMode.HTML
+            text=reply,
+            parse_mode=parse_mode_for(reply)
         )
     except Exception as e:
-        logger.error(f"Failed to notify partner {partner_id}: {e}")
+        logger.error("Failed to notify partner %s: %s", partner_id, e)
 
 # Callback handlers (keep existing ones but they won't be used much now)
-def contact_user_callback(update: Update, context: CallbackContext) -> None:
+async def contact_user_callback(update: Update, context: CallbackContext) -> None:
     """Handle contact user callback."""
     query = update.callback_query
     user = query.from_user
     user_id = str(user.id)
+    t = await make_translator(user_id, get_context_language(context, user_id))
     
     # Extract target user ID
-    target_id = query.data.replace("contact_", "")
+    target_id = query.data.removeprefix("contact_")
     
     # Get user data
     user_data = get_user_data(user_id)
     target_data = get_user_data(target_id)
     
-    if not target_data:
-        query.answer()
-        query.edit_message_text(
-            get_text(user_id, "user_not_found"),
-            parse_mode=ParseMode.HTML
-        )
-        return
-    
-    # Check if target user is still available
+    # Check if target user exists and is still available
     session_manager = get_session_manager()
-    if session_manager.get_chat_partner(target_id):
-        query.answer()
-        query.edit_message_text(
-            get_text(user_id, "user_not_found"),
-            parse_mode=ParseMode.HTML
+    if not target_data or session_manager.get_chat_partner(target_id):
+        reply = t("user_not_found")
+        await asyncio.gather(
+            query.answer(),
+            query.edit_message_text(reply, parse_mode=parse_mode_for(reply))
         )
         return
     
@@ -185,30 +232,31 @@ def contact_user_callback(update: Update, context: CallbackContext) -> None:
     session_manager.set_chat_partner(user_id, target_id)
     session_manager.set_chat_partner(target_id, user_id)
     
-    # Notify both users
-    query.answer()
-    query.edit_message_text(
-        get_text(user_id, "contact_established"),
-        parse_mode=ParseMode.HTML
+    # Notify both users concurrently
+    confirmation = t("contact_established")
+    notification = await aget_text(
+        target_id, "new_contact",
+        name=user_data.get("name", "Unknown")
     )
-    
-    # Notify target user
-    try:
+    _, confirm_result, notify_result = await asyncio.gather(
+        query.answer(),
+        query.edit_message_text(confirmation, parse_mode=parse_mode_for(confirmation)),
         context.bot.send_message(
             chat_id=int(target_id),
-            text=get_text(
-                target_id, "new_contact",
-                name=user_data.get("name", "Unknown")
-            ),
-            parse_mode=ParseMode.HTML
-        )
-    except Exception as e:
-        logger.error(f"Failed to notify target user {target_id}: {e}")
+            text=notification,
+            parse_mode=parse_mode_for(notification)
+        ),
+        return_exceptions=True
+    )
+    if isinstance(confirm_result, Exception):
+        logger.error("Failed to confirm contact to user %s: %s", user_id, confirm_result)
+    if isinstance(notify_result, Exception):
+        logger.error("Failed to notify target user %s: %s", target_id, notify_result)
     
     # Forward connection log to admin
     message_forwarder = get_message_forwarder()
     if message_forwarder:
-        message_forwarder.forward_connection_log(user_data, target_data)
+        await message_forwarder.forward_connection_log(user_data, target_data)
 
 def accept_contact_callback(update: Update, context: CallbackContext) -> None:
     """Handle accept contact callback - legacy function."""
@@ -2,36 +2,55 @@
 Enhanced user handlers module for MultiLangTranslator Bot
 """
 
+import functools
 import logging
 from telegram import Update, ReplyKeyboardMarkup, KeyboardButton, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import CallbackContext
-from telegram.constants import ParseMode
 
-from localization import get_text, get_user_language
-from data_handler import get_user_data, update_user_data
+from localization import get_text, make_translator, get_user_language, get_context_language, invalidate_user_language, parse_mode_for, register_render_cache
+from data_handler import get_user_data, update_user_data, async_update_user_data, user_exists
 from core.session import get_session_manager
 import config
 
 logger = logging.getLogger(__name__)
 
-def create_main_keyboard(user_id: str, language: str = "en") -> list:
-    """Create main menu keyboard based on user's language."""
+# Profile setup confirmation messages
+_GENDER_SET_TMPL = "✅ Gender: %s"
+_COUNTRY_SET_TMPL = "✅ Country: %s"
+
+@functools.lru_cache(maxsize=32)
+def _main_menu_for_lang(lang: str) -> ReplyKeyboardMarkup:
+    """Build the main menu keyboard once per language."""
     keyboard = [
-        [KeyboardButton(get_text(user_id, "menu_search"))],
-        [KeyboardButton(get_text(user_id, "menu_profile")), KeyboardButton(get_text(user_id, "menu_settings"))],
-        [KeyboardButton(get_text(user_id, "menu_help")), KeyboardButton(get_text(user_id, "menu_payment"))],
-        [KeyboardButton(get_text(user_id, "disconnect"))]
+        [KeyboardButton(get_text(None, "menu_search", lang_code=lang))],
+        [KeyboardButton(get_text(None, "menu_profile", lang_code=lang)), KeyboardButton(get_text(None, "menu_settings", lang_code=lang))],
+        [KeyboardButton(get_text(None, "menu_help", lang_code=lang)), KeyboardButton(get_text(None, "menu_payment", lang_code=lang))],
+        [KeyboardButton(get_text(None, "disconnect", lang_code=lang))]
     ]
-    return keyboard
+    return ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=False)
+
+register_render_cache(_main_menu_for_lang.cache_clear)
+
+def create_main_keyboard(user_id: str, language: str = None) -> ReplyKeyboardMarkup:
+    """Get the main menu keyboard for the user's language."""
+    return _main_menu_for_lang(language or get_user_language(user_id))
 
-def start(update: Update, context: CallbackContext) -> None:
+def _log_write_failure(task) -> None:
+    """Log errors from background user data writes."""
+    if not task.cancelled() and task.exception():
+        logger.error("Background user data write failed: %s", task.exception())
+
+async def start(update: Update, context: CallbackContext) -> None:
     """Handle /start command - profile setup."""
     user = update.effective_user
     user_id = str(user.id)
+    lang = get_context_language(context, user_id)
+    t = await make_translator(user_id, lang)
     
-    # Initialize user data
-    user_data = get_user_data(user_id)
-    if not user_data:
+    # Initialize user data; get_user_data returns defaults for unknown users
+    if user_exists(user_id):
+        user_data = get_user_data(user_id)
+    else:
         user_data = {
             "user_id": user_id,
             "username": user.username,
@@ -40,7 +59,9 @@ def start(update: Update, context: CallbackContext) -> None:
             "language": config.DEFAULT_LANGUAGE,
             "profile_complete": False
         }
-        update_user_data(user_id, user_data)
+        # Write behind: persist while the welcome reply is sent
+        write_task = context.application.create_task(async_update_user_data(user_id, user_data))
+        write_task.add_done_callback(_log_write_failure)
     
     # Get session manager
     session_manager = get_session_manager()
@@ -48,11 +69,10 @@ def start(update: Update, context: CallbackContext) -> None:
     # Check if profile is already complete
     if user_data.get("profile_complete", False):
         # Show main menu
-        keyboard = create_main_keyboard(user_id, user_data.get("language", "en"))
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=False)
+        reply_markup = create_main_keyboard(user_id, lang)
         
-        profile_text = get_text(
-            user_id, "profile_complete",
+        profile_text = t(
+            "profile_complete",
             name=user_data.get("name", "Unknown"),
             age=user_data.get("age", "Unknown"),
             gender=user_data.get("gender", "Unknown"),
@@ -60,10 +80,10 @@ def start(update: Update, context: CallbackContext) -> None:
             language=user_data.get("language", "Unknown")
         )
         
-        update.message.reply_text(
+        await update.message.reply_text(
             profile_text,
             reply_markup=reply_markup,
-            parse_mode=ParseMode.HTML
+            parse_mode=parse_mode_for(profile_text)
         )
         return
     
@@ -85,68 +105,76 @@ def start(update: Update, context: CallbackContext) -> None:
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
-    update.message.reply_text(
-        get_text(user_id, "welcome"),
+    reply = t("welcome")
+    await update.message.reply_text(
+        reply,
         reply_markup=reply_markup,
-        parse_mode=ParseMode.HTML
+        parse_mode=parse_mode_for(reply)
     )
 
-def menu_command(update: Update, context: CallbackContext) -> None:
+async def menu_command(update: Update, context: CallbackContext) -> None:
     """Handle /menu command."""
     user = update.effective_user
     user_id = str(user.id)
+    lang = get_context_language(context, user_id)
+    t = await make_translator(user_id, lang)
     
     user_data = get_user_data(user_id)
     
     if not user_data.get("profile_complete", False):
-        update.message.reply_text(
-            get_text(user_id, "profile_incomplete"),
-            parse_mode=ParseMode.HTML
+        reply = t("profile_incomplete")
+        await update.message.reply_text(
+            reply,
+            parse_mode=parse_mode_for(reply)
         )
         return
     
     # Create and send main menu
-    keyboard = create_main_keyboard(user_id, user_data.get("language", "en"))
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=False)
+    reply_markup = create_main_keyboard(user_id, lang)
     
-    update.message.reply_text(
-        get_text(user_id, "main_menu"),
+    reply = t("main_menu")
+    await update.message.reply_text(
+        reply,
         reply_markup=reply_markup,
-        parse_mode=ParseMode.HTML
+        parse_mode=parse_mode_for(reply)
     )
 
-def handle_language_selection(update: Update, context: CallbackContext) -> None:
+async def handle_language_selection(update: Update, context: CallbackContext) -> None:
     """Handle language selection callback."""
     query = update.callback_query
     user_id = str(query.from_user.id)
     
     # Extract language code
-    lang_code = query.data.replace("lang_", "")
+    lang_code = query.data.removeprefix("lang_")
     
     # Update user data
     user_data = get_user_data(user_id)
     user_data["language"] = lang_code
     update_user_data(user_id, user_data)
+    invalidate_user_language(user_id, context)
+    t = await make_translator(user_id, lang_code)
     
     # Get session manager
     session_manager = get_session_manager()
     session_manager.set_session_state(user_id, "awaiting_name")
     
     # Answer callback and ask for name
-    query.answer()
-    query.edit_message_text(
-        get_text(user_id, "language_set"),
-        parse_mode=ParseMode.HTML
+    await query.answer()
+    reply = t("language_set")
+    await query.edit_message_text(
+        reply,
+        parse_mode=parse_mode_for(reply)
     )
     
     # Ask for name
-    context.bot.send_message(
+    reply = t("enter_name")
+    await context.bot.send_message(
         chat_id=query.message.chat_id,
-        text=get_text(user_id, "enter_name"),
-        parse_mode=ParseMode.HTML
+        text=reply,
+        parse_mode=parse_mode_for(reply)
     )
 
-def handle_text_input(update: Update, context: CallbackContext) -> None:
+async def handle_text_input(update: Update, context: CallbackContext) -> None:
     """Handle text input during profile setup."""
     user = update.effective_user
     user_id = str(user.id)
@@ -155,13 +183,15 @@ def handle_text_input(update: Update, context: CallbackContext) -> None:
     # Get session manager
     session_manager = get_session_manager()
     state = session_manager.get_session_state(user_id)
+    t = await make_translator(user_id, get_context_language(context, user_id))
     
     if state == "awaiting_name":
         # Validate name
         if len(text) < 2 or len(text) > 50:
-            update.message.reply_text(
-                "❌ Please enter a valid name (2-50 characters):",
-                parse_mode=ParseMode.HTML
+            reply = "❌ Please enter a valid name (2-50 characters):"
+            await update.message.reply_text(
+                reply,
+                parse_mode=parse_mode_for(reply)
             )
             return
         
@@ -171,9 +201,10 @@ def handle_text_input(update: Update, context: CallbackContext) -> None:
         update_user_data(user_id, user_data)
         
         session_manager.set_session_state(user_id, "awaiting_age")
-        update.message.reply_text(
-            get_text(user_id, "enter_age"),
-            parse_mode=ParseMode.HTML
+        reply = t("enter_age")
+        await update.message.reply_text(
+            reply,
+            parse_mode=parse_mode_for(reply)
         )
         
     elif state == "awaiting_age":
@@ -181,21 +212,24 @@ def handle_text_input(update: Update, context: CallbackContext) -> None:
         try:
             age = int(text)
             if age < 13:
-                update.message.reply_text(
-                    get_text(user_id, "age_too_young"),
-                    parse_mode=ParseMode.HTML
+                reply = t("age_too_young")
+                await update.message.reply_text(
+                    reply,
+                    parse_mode=parse_mode_for(reply)
                 )
                 return
             elif age > 99:
-                update.message.reply_text(
-                    get_text(user_id, "invalid_age"),
-                    parse_mode=ParseMode.HTML
+                reply = t("invalid_age")
+                await update.message.reply_text(
+                    reply,
+                    parse_mode=parse_mode_for(reply)
                 )
                 return
         except ValueError:
-            update.message.reply_text(
-                get_text(user_id, "invalid_age"),
-                parse_mode=ParseMode.HTML
+            reply = t("invalid_age")
+            await update.message.reply_text(
+                reply,
+                parse_mode=parse_mode_for(reply)
             )
             return
         
@@ -208,24 +242,26 @@ def handle_text_input(update: Update, context: CallbackContext) -> None:
         
         # Gender selection keyboard
         keyboard = [
-            [InlineKeyboardButton(get_text(user_id, "male"), callback_data="gender_male")],
-            [InlineKeyboardButton(get_text(user_id, "female"), callback_data="gender_female")]
+            [InlineKeyboardButton(t("male"), callback_data="gender_male")],
+            [InlineKeyboardButton(t("female"), callback_data="gender_female")]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        update.message.reply_text(
-            get_text(user_id, "select_gender"),
+        reply = t("select_gender")
+        await update.message.reply_text(
+            reply,
             reply_markup=reply_markup,
-            parse_mode=ParseMode.HTML
+            parse_mode=parse_mode_for(reply)
         )
 
-def handle_gender_selection(update: Update, context: CallbackContext) -> None:
+async def handle_gender_selection(update: Update, context: CallbackContext) -> None:
     """Handle gender selection callback."""
     query = update.callback_query
     user_id = str(query.from_user.id)
     
     # Extract gender
-    gender = query.data.replace("gender_", "")
+    gender = query.data.removeprefix("gender_")
+    t = await make_translator(user_id, get_context_language(context, user_id))
     
     # Update user data
     user_data = get_user_data(user_id)
@@ -237,10 +273,11 @@ def handle_gender_selection(update: Update, context: CallbackContext) -> None:
     session_manager.set_session_state(user_id, "awaiting_country")
     
     # Answer callback
-    query.answer()
-    query.edit_message_text(
-        f"✅ Gender: {get_text(user_id, gender)}",
-        parse_mode=ParseMode.HTML
+    await query.answer()
+    reply = _GENDER_SET_TMPL % t(gender)
+    await query.edit_message_text(
+        reply,
+        parse_mode=parse_mode_for(reply)
     )
     
     # Country selection keyboard
@@ -271,20 +308,23 @@ def handle_gender_selection(update: Update, context: CallbackContext) -> None:
     
     reply_markup = InlineKeyboardMarkup(keyboard)
     
-    context.bot.send_message(
+    reply = t("select_country")
+    await context.bot.send_message(
         chat_id=query.message.chat_id,
-        text=get_text(user_id, "select_country"),
+        text=reply,
         reply_markup=reply_markup,
-        parse_mode=ParseMode.HTML
+        parse_mode=parse_mode_for(reply)
     )
 
-def handle_country_selection(update: Update, context: CallbackContext) -> None:
+async def handle_country_selection(update: Update, context: CallbackContext) -> None:
     """Handle country selection callback."""
     query = update.callback_query
     user_id = str(query.from_user.id)
     
     # Extract country code
-    country_code = query.data.replace("country_", "")
+    country_code = query.data.removeprefix("country_")
+    lang = get_context_language(context, user_id)
+    t = await make_translator(user_id, lang)
     
     # Country mapping
     country_names = {
@@ -322,18 +362,18 @@ def handle_country_selection(update: Update, context: CallbackContext) -> None:
     session_manager.clear_session(user_id)
     
     # Answer callback
-    query.answer()
-    query.edit_message_text(
-        f"✅ Country: {country_name}",
-        parse_mode=ParseMode.HTML
+    await query.answer()
+    reply = _COUNTRY_SET_TMPL % country_name
+    await query.edit_message_text(
+        reply,
+        parse_mode=parse_mode_for(reply)
     )
     
     # Show completed profile and main menu
-    keyboard = create_main_keyboard(user_id, user_data.get("language", "en"))
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=False)
+    reply_markup = create_main_keyboard(user_id, lang)
     
-    profile_text = get_text(
-        user_id, "profile_complete",
+    profile_text = t(
+        "profile_complete",
         name=user_data.get("name", "Unknown"),
         age=user_data.get("age", "Unknown"),
         gender=user_data.get("gender", "Unknown"),
@@ -341,9 +381,24 @@ def handle_country_selection(update: Update, context: CallbackContext) -> None:
         language=user_data.get("language", "Unknown")
     )
     
-    context.bot.send_message(
+    await context.bot.send_message(
         chat_id=query.message.chat_id,
         text=profile_text,
         reply_markup=reply_markup,
-        parse_mode=ParseMode.HTML
-    )
\ No newline at end of file
+        parse_mode=parse_mode_for(profile_text)
+    )
+
+def register_user_handlers(application):
+    """
+    Register user command handlers.
+    
+    The handlers keep no per-user locks, so they are safe to run
+    concurrently; the application's HTTPX connection pool bounds how
+    many replies are in flight at once.
+    """
+    from telegram.ext import CommandHandler
+    
+    application.add_handler(CommandHandler("start", start))
+    application.add_handler(CommandHandler("menu", menu_command))
+    
+    logger.info("User handlers registered")
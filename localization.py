@@ -2,190 +2,438 @@
 Localization module for MultiLangTranslator Bot
 """
 
+import asyncio
+import functools
 import json
 import logging
+import marshal
+import mmap
 import os
-from typing import Dict, Any
+import string
+import sys
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Mapping, Optional, Tuple
+from telegram.constants import ParseMode
 import config
 logger = logging.getLogger(__name__)
 
-# Cache for loaded translations
-loaded_translations: Dict[str, Dict[str, str]] = {}
+# Prefer orjson for parsing translation files; fall back to stdlib json
+try:
+    import orjson
+    # orjson parses a memoryview of the mapped file without copying it
+    _loads = orjson.loads
+except ImportError:
+    def _loads(data):
+        # Stdlib json does not accept memoryview
+        return json.loads(bytes(data))
+
+# Cache for loaded translations (read-only views)
+loaded_translations: Dict[str, Mapping[str, str]] = {}
+
+# One shared object per distinct translation string across all languages
+_value_pool: Dict[str, str] = {}
+
+# Pre-parsed format templates keyed by (language, key); () means the
+# template has no fields, None means it needs the full str.format machinery
+_PARSED: Dict[Tuple[str, str], Optional[tuple]] = {}
+_NOT_PARSED = object()
 
-def load_translation_file(language_code: str) -> Dict[str, str]:
-    """Load translation file for a specific language from locales folder."""
+# Clear functions of caches elsewhere that hold rendered translations
+_render_cache_hooks: List[Callable[[], None]] = []
+_formatter = string.Formatter()
+
+# Per-user language cache: user_id -> (cached_at, language), oldest first
+_lang_cache: Dict[str, Tuple[float, str]] = {}
+LANG_CACHE_TTL = 60  # seconds
+LANG_CACHE_MAX_SIZE = 10000
+
+def _parse_template(template: str) -> Optional[tuple]:
+    """
+    Split a str.format template into (literal, field, conversion, spec) parts.
+
+    Returns an empty tuple when the template has no fields or escapes and
+    renders as itself.
+    """
+    if "{" not in template and "}" not in template:
+        return ()
     try:
-        # Try different possible file paths - using 'locales' as the correct folder name
-        possible_paths = [
-            f"locales/{language_code}.json",
-            f"locales/{language_code.lower()}.json",
-            f"locales/{language_code.upper()}.json",
-            f"locals/{language_code}.json",  # fallback to old name
-            f"translations/{language_code}.json",  # another fallback
-            f"lang/{language_code}.json"  # another common pattern
-        ]
-        
-        translations = {}
-        file_loaded = False
-        
-        for file_path in possible_paths:
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                        if content:  # Check if file is not empty
-                            translations = json.loads(content)
-                        else:
-                            logger.warning(f"Translation file {file_path} is empty")
-                            continue
-                    logger.info(f"Loaded translations for '{language_code}' from {file_path}")
-                    file_loaded = True
-                    break
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.error(f"Error loading {file_path}: {e}")
-                    continue
-        
-        if not file_loaded:
-            logger.warning(f"No translation file found for language '{language_code}' in any of: {possible_paths}")
-            # Create basic fallback translations
-            translations = create_fallback_translations(language_code)
-        
-        # Cache the translations
-        loaded_translations[language_code] = translations
+        parts = []
+        for literal, field, spec, conversion in _formatter.parse(template):
+            # Only plain named fields are rendered here
+            if field is not None and (not field.isidentifier() or "{" in spec):
+                return None
+            parts.append((literal, field, conversion, spec))
+        return tuple(parts)
+    except ValueError:
+        return None
+
+def _render_parsed(parts: tuple, kwargs: Dict[str, Any]) -> str:
+    """Render a pre-parsed template with the given keyword arguments."""
+    out = []
+    for literal, field, conversion, spec in parts:
+        out.append(literal)
+        if field is not None:
+            value = kwargs[field]
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            out.append(format(value, spec))
+    return "".join(out)
+
+def _build_locale_index() -> Dict[str, Path]:
+    """Map lowercase language codes to translation files in one directory scan each."""
+    index: Dict[str, Path] = {}
+    # The configured directory wins over the legacy folder names
+    for directory in (config.LOCALES_DIR, "locals", "translations", "lang"):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith('.json'):
+                        index.setdefault(entry.name[:-len('.json')].lower(), Path(entry.path))
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.error("Error scanning translation directory '%s': %s", directory, e)
+    return index
+
+def _marshal_cache_path(path: Path) -> Path:
+    """Compiled side file for a translation file, e.g. locales/.cache/en.marshal."""
+    return path.parent / ".cache" / f"{path.stem}.marshal"
+
+def _read_translation_file(path: Path) -> Optional[Dict[str, str]]:
+    """
+    Load a translation file, or return None if it is empty.
+
+    The parsed dict is kept in a marshal side file; it is used instead of
+    the JSON while it is newer than its source.
+    """
+    cache_path = _marshal_cache_path(path)
+    try:
+        if cache_path.stat().st_mtime_ns > path.stat().st_mtime_ns:
+            with open(cache_path, 'rb') as f:
+                return marshal.load(f)
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.warning("Ignoring unreadable translation cache %s: %s", cache_path, e)
+
+    translations = _parse_translation_file(path)
+    if translations is not None:
+        _write_marshal_cache(cache_path, translations)
+    return translations
+
+def _write_marshal_cache(cache_path: Path, translations: Dict[str, str]) -> None:
+    """Write the compiled side file; failures only cost the next startup a parse."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            marshal.dump(translations, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError) as e:
+        logger.debug("Could not write translation cache %s: %s", cache_path, e)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+def _parse_translation_file(path: Path) -> Optional[Dict[str, str]]:
+    """Parse a memory-mapped translation file, or return None if it is empty."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if not size:
+            logger.warning("Translation file %s is empty", path)
+            return None
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+    finally:
+        os.close(fd)
+
+def _freeze_translations(translations: Dict[str, str]) -> Mapping[str, str]:
+    """Share key and value strings across languages, and wrap in a read-only view."""
+    return MappingProxyType({
+        sys.intern(k): _value_pool.setdefault(v, v) if isinstance(v, str) else v
+        for k, v in translations.items()
+    })
+
+def _merge_default(language_code: str, translations: Dict[str, str]) -> Dict[str, str]:
+    """Layer a language over the default language so one lookup covers both."""
+    if language_code == config.DEFAULT_LANGUAGE:
         return translations
-        
-    except Exception as e:
-        logger.error(f"Unexpected error loading translations for '{language_code}': {e}")
-        return create_fallback_translations(language_code)
-
-def create_fallback_translations(language_code: str) -> Dict[str, str]:
-    """Create basic fallback translations when files are missing."""
-    return {
-        "welcome": "Welcome {name}! 🎉\n\nThis is MultiLangTranslator Bot - your gateway to connecting with people from different languages and cultures around the world!\n\nUse the menu below to get started:",
-        "help_text": "🤖 **MultiLangTranslator Bot Help**\n\n**Available Commands:**\n/start - Start the bot\n/menu - Show main menu\n/help - Show help\n/profile - Manage profile\n/search - Find partners\n/settings - Bot settings\n\n**Features:**\n🌍 Connect with people worldwide\n💬 Multi-language support\n🔍 Advanced partner search\n⭐ Premium features available",
-        "main_menu": "🏠 **Main Menu**\n\nChoose an option from the buttons below:",
-        "menu_profile": "👤 Profile",
-        "menu_search": "🔍 Search Partners", 
-        "menu_settings": "⚙️ Settings",
-        "menu_help": "❓ Help",
-        "menu_payment": "💳 Premium",
-        "profile_info": "👤 **Your Profile**\n\nName: {name}\nLanguage: {language}\nStatus: {status}",
-        "search_partners": "🔍 **Find Language Partners**\n\nSearching for people to connect with...",
-        "settings_menu": "⚙️ **Settings**\n\nManage your preferences here.",
-        "premium_info": "⭐ **Premium Features**\n\n• Advanced search filters\n• Unlimited connections\n• Priority matching\n• Ad-free experience",
-        "user_not_found": "❌ User not found",
-        "contact_request": "📞 Contact request from {name}",
-        "accept_contact": "✅ Accept",
-        "decline_contact": "❌ Decline",
-        "contact_accepted": "✅ Contact accepted by {name}",
-        "contact_declined": "❌ Contact declined by {name}",
-        "contact_request_sent": "📤 Contact request sent to {name}",
-        "contact_accepted_confirmation": "✅ You accepted contact from {name}",
-        "contact_declined_confirmation": "❌ You declined contact from {name}",
-        "no_username": "No username"
-    }
+    base = loaded_translations.get(config.DEFAULT_LANGUAGE)
+    if base is None:
+        base = _load_translation_file(config.DEFAULT_LANGUAGE)
+    return {**base, **translations}
+
+def _clear_render_caches() -> None:
+    """
+    Drop rendered strings after the loaded translations change.
+
+    Loads run in worker threads, so _PARSED is swapped for a fresh dict
+    rather than cleared under a render that is reading it.
+    """
+    global _PARSED
+    _PARSED = {}
+    _render.cache_clear()
+    for clear in _render_cache_hooks:
+        clear()
+
+def register_render_cache(clear: Callable[[], None]) -> None:
+    """Register a cache of translated strings to clear when translations reload."""
+    _render_cache_hooks.append(clear)
+
+def _load_translation_file(language_code: str) -> Mapping[str, str]:
+    """
+    Load translation file for a specific language from locales folder.
+
+    Only the default language is loaded on import; other languages are
+    loaded here on first use or by the background preload.
+    """
+    file_path = _locale_index.get(language_code.lower())
+    translations = None
+    if file_path is None:
+        logger.warning("No translation file found for language '%s'", language_code)
+    else:
+        try:
+            translations = _read_translation_file(file_path)
+            if translations is not None:
+                logger.info("Loaded translations for '%s' from %s", language_code, file_path)
+        except (ValueError, OSError) as e:
+            logger.error("Error loading %s: %s", file_path, e)
+
+    if translations is None:
+        # Create basic fallback translations
+        translations = create_fallback_translations(language_code)
+
+    # Cache the translations as a read-only view
+    loaded_translations[language_code] = _freeze_translations(
+        _merge_default(language_code, translations)
+    )
+    _clear_render_caches()
+    return loaded_translations[language_code]
+
+# Basic translations used when no file exists for a language
+_FALLBACK_TRANSLATIONS: Mapping[str, str] = MappingProxyType({
+    "welcome": "Welcome {name}! 🎉\n\nThis is MultiLangTranslator Bot - your gateway to connecting with people from different languages and cultures around the world!\n\nUse the menu below to get started:",
+    "help_text": "🤖 **MultiLangTranslator Bot Help**\n\n**Available Commands:**\n/start - Start the bot\n/menu - Show main menu\n/help - Show help\n/profile - Manage profile\n/search - Find partners\n/settings - Bot settings\n\n**Features:**\n🌍 Connect with people worldwide\n💬 Multi-language support\n🔍 Advanced partner search\n⭐ Premium features available",
+    "main_menu": "🏠 **Main Menu**\n\nChoose an option from the buttons below:",
+    "menu_profile": "👤 Profile",
+    "menu_search": "🔍 Search Partners", 
+    "menu_settings": "⚙️ Settings",
+    "menu_help": "❓ Help",
+    "menu_payment": "💳 Premium",
+    "profile_info": "👤 **Your Profile**\n\nName: {name}\nLanguage: {language}\nStatus: {status}",
+    "search_partners": "🔍 **Find Language Partners**\n\nSearching for people to connect with...",
+    "settings_menu": "⚙️ **Settings**\n\nManage your preferences here.",
+    "premium_info": "⭐ **Premium Features**\n\n• Advanced search filters\n• Unlimited connections\n• Priority matching\n• Ad-free experience",
+    "user_not_found": "❌ User not found",
+    "contact_request": "📞 Contact request from {name}",
+    "accept_contact": "✅ Accept",
+    "decline_contact": "❌ Decline",
+    "contact_accepted": "✅ Contact accepted by {name}",
+    "contact_declined": "❌ Contact declined by {name}",
+    "contact_request_sent": "📤 Contact request sent to {name}",
+    "contact_accepted_confirmation": "✅ You accepted contact from {name}",
+    "contact_declined_confirmation": "❌ You declined contact from {name}",
+    "no_username": "No username"
+})
+
+def create_fallback_translations(language_code: str) -> Mapping[str, str]:
+    """Basic fallback translations when files are missing; shared and read-only."""
+    return _FALLBACK_TRANSLATIONS
+
+def parse_mode_for(text: str) -> Optional[str]:
+    """HTML parse mode only when the text contains markup, otherwise None."""
+    return ParseMode.HTML if "<" in text else None
 
 def get_user_language(user_id: str) -> str:
     """Get the language code for a specific user."""
+    user_id = str(user_id)
+    cached = _lang_cache.get(user_id)
+    if cached and time.monotonic() - cached[0] < LANG_CACHE_TTL:
+        return cached[1]
     try:
-        from data_handler import get_user_data
         user_data = get_user_data(user_id)
-        return user_data.get("language", config.DEFAULT_LANGUAGE)
-    except ImportError:
-        logger.warning("data_handler not available, using default language")
-        return config.DEFAULT_LANGUAGE
+        language = user_data.get("language", config.DEFAULT_LANGUAGE)
     except Exception as e:
-        logger.error(f"Error getting user language for {user_id}: {e}")
+        logger.error("Error getting user language for %s: %s", user_id, e)
         return config.DEFAULT_LANGUAGE
+    _cache_user_language(user_id, language)
+    return language
+
+def _cache_user_language(user_id: str, language: str) -> None:
+    """Cache a user's language, keeping the cache under LANG_CACHE_MAX_SIZE."""
+    now = time.monotonic()
+    # Re-insert so the dict stays ordered by caching time
+    _lang_cache.pop(user_id, None)
+    # Oldest entries come first; drop them while they are expired or the
+    # cache is full
+    while _lang_cache:
+        oldest = next(iter(_lang_cache))
+        if now - _lang_cache[oldest][0] < LANG_CACHE_TTL and len(_lang_cache) < LANG_CACHE_MAX_SIZE:
+            break
+        _lang_cache.pop(oldest, None)
+    _lang_cache[user_id] = (now, language)
+
+def get_context_language(context, user_id: str) -> str:
+    """Get a user's language, cached in ``context.user_data`` for LANG_CACHE_TTL."""
+    user_data = getattr(context, "user_data", None)
+    if user_data is None:
+        return get_user_language(user_id)
+    cached = user_data.get("_lang")
+    if cached and time.monotonic() - cached[0] < LANG_CACHE_TTL:
+        return cached[1]
+    language = get_user_language(user_id)
+    user_data["_lang"] = (time.monotonic(), language)
+    return language
+
+def invalidate_user_language(user_id: str, context=None) -> None:
+    """Drop the cached language for a user after it changes."""
+    _lang_cache.pop(str(user_id), None)
+    user_data = getattr(context, "user_data", None)
+    if user_data is not None:
+        user_data.pop("_lang", None)
 
 def get_text(user_id: str, key: str, lang_code: str = None, **kwargs) -> str:
     """Get a localized text string for a user."""
+    # Get the effective language
+    effective_lang = lang_code if lang_code is not None else get_user_language(user_id)
+
+    if not kwargs:
+        # Nothing to format: return the stored string itself
+        message = loaded_translations.get(effective_lang, {}).get(key)
+        if message is not None:
+            return message
+        return _render(effective_lang, key, ())
+
+    kwargs_items = tuple(sorted(kwargs.items()))
     try:
-        # Get the effective language
-        if lang_code is None:
-            try:
-                user_data = get_user_data(user_id) if 'get_user_data' in globals() else {}
-                effective_lang = user_data.get("language", config.DEFAULT_LANGUAGE)
-            except:
-                effective_lang = config.DEFAULT_LANGUAGE
-        else:
-            effective_lang = lang_code
-
-        # Load translation file if not cached
-        if effective_lang not in loaded_translations:
-            load_translation_file(effective_lang)
-
-        translations = loaded_translations.get(effective_lang, {})
-
-        # Fallback to default language if translation not found
-        if not translations or key not in translations:
-            if effective_lang != config.DEFAULT_LANGUAGE:
-                return get_text(user_id, key, config.DEFAULT_LANGUAGE, **kwargs)
-            else:
-                logger.warning(f"Missing translation key '{key}' in default language '{config.DEFAULT_LANGUAGE}'")
-                return f"Missing translation: {key}"
-
-        message = translations[key]
-        
-        # Format message with provided kwargs
-        if kwargs:
-            try:
+        hash(kwargs_items)
+    except TypeError:
+        # Unhashable placeholder values bypass the cache
+        return _render.__wrapped__(effective_lang, key, kwargs_items)
+    return _render(effective_lang, key, kwargs_items)
+
+async def make_translator(user_id: str, lang_code: str = None) -> Callable[..., str]:
+    """
+    Return ``t(key, **kwargs)`` bound to a user and their language.
+
+    The language is resolved once, and a language that was not preloaded
+    is read from disk in a worker thread so a cache miss does not stall
+    the event loop.
+    """
+    effective_lang = lang_code if lang_code is not None else get_user_language(user_id)
+    if effective_lang not in loaded_translations:
+        await asyncio.to_thread(_load_translation_file, effective_lang)
+    return functools.partial(get_text, user_id, lang_code=effective_lang)
+
+async def aget_text(user_id: str, key: str, lang_code: str = None, **kwargs) -> str:
+    """Get a localized text string from async handlers."""
+    t = await make_translator(user_id, lang_code)
+    return t(key, **kwargs)
+
+@functools.lru_cache(maxsize=4096)
+def _render(effective_lang: str, key: str, kwargs_items: tuple) -> str:
+    """Render a translation for a resolved language and sorted kwargs items."""
+    # Load translation file if not cached
+    if effective_lang not in loaded_translations:
+        _load_translation_file(effective_lang)
+
+    # Every language is merged over the default, so one lookup covers the fallback
+    message = loaded_translations.get(effective_lang, {}).get(key)
+    if message is None:
+        logger.warning("Missing translation key '%s' in default language '%s'", key, config.DEFAULT_LANGUAGE)
+        return f"Missing translation: {key}"
+    
+    # Format message with provided kwargs
+    if kwargs_items:
+        kwargs = dict(kwargs_items)
+        try:
+            cache_key = (effective_lang, key)
+            parsed = _PARSED.get(cache_key, _NOT_PARSED)
+            if parsed is _NOT_PARSED:
+                parsed = _PARSED[cache_key] = _parse_template(message)
+            if parsed:
+                message = _render_parsed(parsed, kwargs)
+            elif parsed is None:
                 message = message.format(**kwargs)
-            except KeyError as e:
-                logger.error(f"Missing placeholder {e} in translation key '{key}' for language '{effective_lang}'")
-            except Exception as e:
-                logger.error(f"Error formatting message for key '{key}': {e}")
+        except KeyError as e:
+            logger.error("Missing placeholder %s in translation key '%s' for language '%s'", e, key, effective_lang)
+        except Exception as e:
+            logger.error("Error formatting message for key '%s': %s", key, e)
 
-        return message
-        
-    except Exception as e:
-        logger.error(f"Error getting text for key '{key}', user '{user_id}': {e}")
-        return f"Error: {key}"
+    return message
+
+def start_translation_preload() -> threading.Thread:
+    """
+    Preload every translation file on a background thread.
+
+    Called at startup once logging is configured, rather than at import,
+    so the thread's log records reach the configured handlers.
+    """
+    thread = threading.Thread(target=preload_translations, name="preload-translations", daemon=True)
+    thread.start()
+    return thread
 
 def preload_translations():
-    """Preload common translations to improve performance."""
-    try:
-        # Get list of available translation files from locales directory
-        locales_dir = "locales"
-        if not os.path.exists(locales_dir):
-            logger.warning(f"Locales directory '{locales_dir}' not found")
-            return
-        
-        translation_files = [f for f in os.listdir(locales_dir) if f.endswith('.json')]
-        
-        if not translation_files:
-            logger.warning(f"No translation files found in '{locales_dir}'")
-            return
-        
-        languages = []
-        for file in translation_files:
-            lang_code = file.replace('.json', '')
-            languages.append(lang_code)
-            load_translation_file(lang_code)
-        
-        logger.info(f"Preloaded translations for: {', '.join(languages)}")
-        
-    except Exception as e:
-        logger.error(f"Error preloading translations: {e}")
+    """Load every indexed translation file in one pass."""
+    if not _locale_index:
+        logger.warning("No translation files found in '%s'", config.LOCALES_DIR)
+        return
+
+    parsed = {}
+    for lang_code, path in _locale_index.items():
+        try:
+            translations = _read_translation_file(path)
+        except (ValueError, OSError) as e:
+            logger.error("Error loading %s: %s", path, e)
+            continue
+        if translations is not None:
+            parsed[lang_code] = translations
+
+    # Cache the default language first so the others can merge over it
+    default = parsed.pop(config.DEFAULT_LANGUAGE, None)
+    if default is not None:
+        loaded_translations[config.DEFAULT_LANGUAGE] = _freeze_translations(default)
+    for lang_code, translations in parsed.items():
+        loaded_translations[lang_code] = _freeze_translations(
+            _merge_default(lang_code, translations)
+        )
+    languages = ([config.DEFAULT_LANGUAGE] if default is not None else []) + list(parsed)
 
-def get_available_languages() -> list:
-    """Get list of available languages."""
+    _clear_render_caches()
+    logger.info("Preloaded translations for: %s", ', '.join(languages))
+
+@functools.lru_cache(maxsize=1)
+def get_available_languages() -> Tuple[str, ...]:
+    """
+    Get the available languages.
+
+    The locale files do not change at runtime, so the result is computed
+    once; call ``get_available_languages.cache_clear()`` after adding files.
+    """
     try:
-        locales_dir = "locales"
-        if not os.path.exists(locales_dir):
-            return [config.DEFAULT_LANGUAGE]
-        
-        translation_files = [f for f in os.listdir(locales_dir) if f.endswith('.json')]
-        languages = [f.replace('.json', '') for f in translation_files]
+        try:
+            with os.scandir(config.LOCALES_DIR) as entries:
+                languages = tuple(
+                    entry.name[:-len('.json')] for entry in entries
+                    if entry.is_file(follow_symlinks=False) and entry.name.endswith('.json')
+                )
+        except FileNotFoundError:
+            return (config.DEFAULT_LANGUAGE,)
         
         if not languages:
-            return [config.DEFAULT_LANGUAGE]
+            return (config.DEFAULT_LANGUAGE,)
         
         return languages
         
     except Exception as e:
-        logger.error(f"Error getting available languages: {e}")
-        return [config.DEFAULT_LANGUAGE]
+        logger.error("Error getting available languages: %s", e)
+        return (config.DEFAULT_LANGUAGE,)
 
 # Import get_user_data if available
 try:
@@ -195,8 +443,9 @@ except ImportError:
     def get_user_data(user_id):
         return {}
 
-# Preload translations on module import
-preload_translations()
-dir("locales")
-with open("locales/en.json") as f:
-    content = f.read()
\ No newline at end of file
+# Index translation files once; lookups never touch the filesystem
+_locale_index = _build_locale_index()
+
+# Load the default language now; the others load on first use or via
+# start_translation_preload()
+_load_translation_file(config.DEFAULT_LANGUAGE)
@@ -2,131 +2,286 @@
 Main module for MultiLangTranslator Bot
 """
 
+import atexit
+import functools
+import gc
+import json
 import logging
+import logging.handlers
 import os
-from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, filters
-from telegram.constants import ParseMode
-import config
-from handlers.user_handlers import (
-    start, menu_command, handle_text_input,
-    handle_language_selection, handle_gender_selection, handle_country_selection
-)
-from handlers.search_handlers import search_partner, disconnect_chat, contact_user_callback
-from handlers.menu_handlers import handle_menu_button, show_help
-from handlers.message_relay import handle_user_message
-from core.message_forwarder import get_message_forwarder
-from flask import Flask
+import queue
+import socket
 import threading
+import time
+from typing import Optional
+from telegram import Update
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
+from telegram.error import TelegramError
+from telegram.ext import TypeHandler
+from telegram.request import HTTPXRequest
+from bot_factory import ALLOWED_UPDATES, create_builder, setup_application
+from aiohttp import web
 
-# Configure logging
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
-logger = logging.getLogger(__name__)
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the asctime seconds once per second."""
+    
+    _cached_time = (None, "")
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_time = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
 
-# Flask app for health check
-app = Flask(__name__)
+# Configure logging; thread and process names are never logged
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+# Records are queued and written by a background thread, so logging on
+# the event loop never blocks on a stderr write
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.basicConfig(handlers=[logging.handlers.QueueHandler(_log_queue)], level=logging.INFO)
+logger = logging.getLogger(__name__)
 
-@app.route('/')
-def health_check():
-    return "Bot is running! 🤖"
+# Health check responses: path -> (content type, body)
+_HEALTH_RESPONSES = {
+    "/": ("text/plain; charset=utf-8", "Bot is running! 🤖".encode()),
+    "/health": ("application/json", b'{"status":"healthy"}'),
+    "/ping": ("text/plain; charset=utf-8", b"pong"),
+}
 
-@app.route('/ping')
-def ping():
-    return "pong"
+async def health_check(request: web.Request) -> web.Response:
+    """Serve a static health check response."""
+    content_type, body = _HEALTH_RESPONSES[request.path]
+    return web.Response(body=body, headers={"Content-Type": content_type})
 
-def run_flask():
-    """Run Flask server in a separate thread."""
-    port = int(os.environ.get('PORT', 10000))
-    app.run(host='0.0.0.0', port=port)
+# Seconds a /status snapshot is reused before psutil is queried again
+STATUS_CACHE_SECONDS = 5
 
-def handle_callback_query(update, context):
-    """Handle all callback queries."""
-    query = update.callback_query
-    data = query.data
+@functools.lru_cache(maxsize=1)
+def _collect_status(bucket: int) -> dict:
+    """Collect host status information; cached per STATUS_CACHE_SECONDS bucket."""
+    status = {
+        "status": "ok",
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    }
+    if psutil is None:
+        return status
     
-    if data.startswith("lang_"):
-        handle_language_selection(update, context)
-    elif data.startswith("gender_"):
-        handle_gender_selection(update, context)
-    elif data.startswith("country_"):
-        handle_country_selection(update, context)
-    elif data.startswith("contact_"):
-        contact_user_callback(update, context)
-    else:
-        query.answer("Unknown action")
-
-def handle_message(update, context):
-    """Handle all text messages."""
-    user_id = str(update.effective_user.id)
+    uptime = int(time.time() - psutil.boot_time())
+    days, remainder = divmod(uptime, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    status.update({
+        "uptime": f"{days}d {hours}h {minutes}m {seconds}s",
+        "cpu_percent": f"{psutil.cpu_percent()}%",
+        "memory_used": f"{psutil.virtual_memory().percent}%",
+        "disk_used": f"{psutil.disk_usage('/').percent}%",
+    })
+    return status
+
+async def status_check(request: web.Request) -> web.Response:
+    """Serve host status information."""
+    return web.json_response(_collect_status(int(time.monotonic() // STATUS_CACHE_SECONDS)))
+
+async def start_health_server(application) -> None:
+    """Start the health check server on the bot's event loop (post_init hook)."""
+    health_app = web.Application()
+    for path in _HEALTH_RESPONSES:
+        health_app.router.add_get(path, health_check)
+    health_app.router.add_get("/status", status_check)
     
-    # Check if user is in profile setup
-    from core.session import get_session_manager
-    session_manager = get_session_manager()
-    state = session_manager.get_session_state(user_id)
+    runner = web.AppRunner(health_app, access_log=None)
+    await runner.setup()
+    port = int(os.environ.get('PORT', 10000))
+    await web.TCPSite(runner, '0.0.0.0', port).start()
+    application.bot_data["health_runner"] = runner
+    logger.info("Health check server listening on port %s", port)
+
+async def stop_health_server(application) -> None:
+    """Stop the health check server (post_shutdown hook)."""
+    runner = application.bot_data.pop("health_runner", None)
+    if runner:
+        await runner.cleanup()
+
+# Lock held for the process lifetime so only one instance polls
+LOCK_FILE = os.path.join(".state", "bot.lock")
+
+def acquire_instance_lock() -> Optional[int]:
+    """
+    Take an exclusive lock on LOCK_FILE.
     
-    if state in ["awaiting_name", "awaiting_age"]:
-        handle_text_input(update, context)
-        return
+    The kernel releases the lock when the process exits, however it
+    exits, so a crash never leaves a stale lock behind.
     
-    # Check if user is in active chat
-    partner_id = session_manager.get_chat_partner(user_id)
-    if partner_id:
-        handle_user_message(update, context)
-        return
+    Returns:
+        The locked file descriptor (keep it open), or None if another
+        instance holds the lock
+    """
+    os.makedirs(os.path.dirname(LOCK_FILE), exist_ok=True)
+    lock_fd = os.open(LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+    if fcntl is None:
+        return lock_fd
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(lock_fd)
+        return None
+    return lock_fd
+
+# getUpdates offset (last handled update_id + 1) kept across restarts
+UPDATE_OFFSET_FILE = os.path.join(".state", "tg_offset.json")
+
+def load_update_offset() -> int:
+    """Read the saved getUpdates offset, or 0 if there is none."""
+    try:
+        with open(UPDATE_OFFSET_FILE, "rb") as f:
+            return int(_loads(f.read())["offset"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return 0
+
+def save_update_offset(offset: int) -> None:
+    """Write the getUpdates offset atomically."""
+    os.makedirs(os.path.dirname(UPDATE_OFFSET_FILE), exist_ok=True)
+    tmp_path = UPDATE_OFFSET_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"offset": offset}, f)
+    os.replace(tmp_path, UPDATE_OFFSET_FILE)
+
+async def track_update_offset(update: Update, context) -> None:
+    """Remember the offset after the newest update seen."""
+    if update.update_id >= context.bot_data.get("update_offset", 0):
+        context.bot_data["update_offset"] = update.update_id + 1
+
+async def on_startup(application) -> None:
+    """post_init hook: start the health server and confirm the saved offset."""
+    if application.bot_data.get("serve_health", True):
+        await start_health_server(application)
     
-    # Handle menu buttons
-    handle_menu_button(update, context)
+    # Confirming the offset marks everything before it as handled, so
+    # polling resumes with updates that arrived while the bot was down
+    offset = application.bot_data.get("update_offset")
+    if offset:
+        try:
+            await application.bot.get_updates(offset=offset, limit=1, timeout=0)
+        except TelegramError as e:
+            logger.warning("Could not confirm saved update offset %s: %s", offset, e)
 
-def main():
-    """Start the bot."""
-    logger.info("🚀 Starting Telegram bot...")
+async def on_shutdown(application) -> None:
+    """post_shutdown hook: save the update offset and stop the health server."""
+    offset = application.bot_data.get("update_offset")
+    if offset:
+        save_update_offset(offset)
+    await stop_health_server(application)
+
+def _prefetch_dns(host: str) -> None:
+    """Resolve a host so the system resolver cache is warm."""
+    try:
+        socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+    except OSError as e:
+        logger.warning("DNS prefetch for %s failed: %s", host, e)
+
+def main(serve_health: bool = True):
+    """
+    Start the bot.
     
-    # Start Flask server in background
-    flask_thread = threading.Thread(target=run_flask, daemon=True)
-    flask_thread.start()
+    Args:
+        serve_health: Serve the health check endpoints on PORT; False when
+            another server (app.py's Flask app) already binds it
+    """
+    logger.info("🚀 Starting Telegram bot...")
     
-    # Create application
-    application = Application.builder().token(config.BOT_TOKEN).build()
+    lock_fd = acquire_instance_lock()
+    if lock_fd is None:
+        logger.error("Another bot instance is already running")
+        return
     
-    # Initialize message forwarder
-    get_message_forwarder(application.bot)
+    # Resolve the API host while handlers are being set up; getMe in
+    # Application.initialize() then warms the TLS connection before polling
+    threading.Thread(target=_prefetch_dns, args=("api.telegram.org",), daemon=True).start()
     
-    # Command handlers
-    application.add_handler(CommandHandler("start", start))
-    application.add_handler(CommandHandler("menu", menu_command))
-    application.add_handler(CommandHandler("search", search_partner))
-    application.add_handler(CommandHandler("disconnect", disconnect_chat))
-    application.add_handler(CommandHandler("help", show_help))
-
-    # Callback query handler
-    application.add_handler(CallbackQueryHandler(handle_callback_query))
+    # Setup allocates many long-lived objects (handlers, filters, cached
+    # data); collect once at the end instead of in many young-generation
+    # passes, and freeze the survivors so later collections skip them
+    gc.disable()
+    try:
+        # getUpdates gets its own small pool so long polls never wait on sends
+        get_updates_request = HTTPXRequest(
+            connection_pool_size=4,
+            pool_timeout=60,
+            read_timeout=30,
+            connect_timeout=10
+        )
+        # The health check server runs on the same event loop as the bot
+        application = (
+            create_builder()
+            .get_updates_request(get_updates_request)
+            .post_init(on_startup)
+            .post_shutdown(on_shutdown)
+            .build()
+        )
+        
+        # Resume from the saved offset; only a first start drops the backlog
+        update_offset = load_update_offset()
+        application.bot_data["update_offset"] = update_offset
+        application.bot_data["serve_health"] = serve_health
+        application.add_handler(TypeHandler(Update, track_update_offset), group=-1)
+        
+        # Handlers, bot_data and services shared with the webhook entry point
+        setup_application(application)
+        
+        gc.collect()
+        gc.freeze()
+    finally:
+        gc.enable()
     
-    # Text message handler
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
+    # Use uvloop's event loop when available (not supported on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        logger.info("uvloop not available, using the default asyncio event loop")
     
-    # Media message handlers
-    media_filter = (
-    filters.PHOTO
-    | filters.Document.ALL
-    | filters.VIDEO
-    | filters.ANIMATION
-    | filters.AUDIO
-    | filters.VOICE
-    | filters.Sticker.ALL
-    | filters.VIDEO_NOTE
-    | filters.CONTACT
-    | filters.LOCATION
-    | filters.VENUE
-) & ~filters.COMMAND
-    application.add_handler(MessageHandler(
-    media_filter, 
-    forward_to_target_group
-))
-    # Start the bot
+    # Start the bot; polling starts with deleteWebhook, which clears a
+    # leftover webhook instead of waiting for it to go away. Pending
+    # updates are only dropped when no offset was saved.
     logger.info("✅ Bot started successfully!")
-    application.run_polling(allowed_updates=["message", "callback_query"])
+    # Signal handlers can only be installed from the main thread; app.py
+    # runs the bot in a worker thread
+    polling_kwargs = {}
+    if threading.current_thread() is not threading.main_thread():
+        polling_kwargs["stop_signals"] = None
+    # Long polling: Telegram holds each getUpdates open for up to 50 s
+    # (under the ~60 s where idle NAT mappings start getting dropped)
+    application.run_polling(
+        allowed_updates=ALLOWED_UPDATES,
+        drop_pending_updates=not update_offset,
+        bootstrap_retries=5,
+        timeout=50,
+        poll_interval=0.0,
+        **polling_kwargs
+    )
 
 if __name__ == '__main__':
     main()
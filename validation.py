@@ -19,6 +19,14 @@ from core.security import get_spam_protection
 from core.notifications import get_notification_manager
 from core.message_forwarder import get_message_forwarder
 
+# Prefer orjson for parsing JSON files; fall back to stdlib json.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
@@ -53,7 +61,7 @@ def validate_bot_configuration(bot: Bot, context: CallbackContext) -> Dict[str,
     if not admin_ids:
         results["warnings"].append("No admin IDs configured")
     else:
-        results["info"].append(f"Admin IDs configured: {', '.join(admin_ids)}")
+        results["info"].append(f"Admin IDs configured: {', '.join(map(str, admin_ids))}")
     
     # Check target group ID
     target_group_id = context.bot_data.get("target_group_id")
@@ -109,8 +117,8 @@ def validate_language_files() -> Dict[str, Any]:
         return results
     
     try:
-        with open(en_file, "r", encoding="utf-8") as f:
-            en_data = json.load(f)
+        with open(en_file, "rb") as f:
+            en_data = _loads(f.read())
     except Exception as e:
         results["success"] = False
         results["errors"].append(f"Error loading English language file: {e}")
@@ -123,8 +131,8 @@ def validate_language_files() -> Dict[str, Any]:
         
         lang_path = os.path.join(locales_dir, lang_file)
         try:
-            with open(lang_path, "r", encoding="utf-8") as f:
-                lang_data = json.load(f)
+            with open(lang_path, "rb") as f:
+                lang_data = _loads(f.read())
             
             # Check for missing keys
             missing_keys = [key for key in en_data if key not in lang_data]
@@ -1,12 +1,17 @@
 """
 Webhook version of MultiLangTranslator Bot
+
+The webhook server is an aiohttp application running on the same
+asyncio event loop as the bot.
 """
 
+import asyncio
+import json
 import logging
 import os
-from flask import Flask, request, jsonify
+from aiohttp import web
 from telegram import Update
-from telegram.ext import Application
+from bot_factory import ALLOWED_UPDATES, build_application
 
 # Configure logging
 logging.basicConfig(
@@ -15,45 +20,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create Flask app
-app = Flask(__name__)
-
 # Global application instance
 application = None
 
-@app.route('/')
-def home():
-    return jsonify({
-        "status": "running",
-        "service": "MultiLangTranslator Bot",
-        "mode": "webhook"
-    })
+# Updates still being processed, referenced so they are not garbage collected
+_pending_updates = set()
+
+# Static endpoint bodies, serialized once at import
+_HOME_BODY = json.dumps({
+    "status": "running",
+    "service": "MultiLangTranslator Bot",
+    "mode": "webhook"
+}, separators=(",", ":")).encode()
+_HEALTH_BODY = b'{"status":"healthy"}'
+_OK_BODY = b'{"status":"ok"}'
+
+async def home(request: web.Request) -> web.Response:
+    return web.Response(body=_HOME_BODY, content_type="application/json")
 
-@app.route('/health')
-def health():
-    return jsonify({"status": "healthy"})
+async def health(request: web.Request) -> web.Response:
+    return web.Response(body=_HEALTH_BODY, content_type="application/json")
 
-@app.route('/webhook', methods=['POST'])
-async def webhook():
-    """Handle incoming webhook updates"""
+async def _process_update(update):
+    """Process an update, logging errors since no response waits for it."""
+    try:
+        await application.process_update(update)
+    except Exception:
+        logger.exception("Error processing update %s", update.update_id)
+
+async def webhook(request: web.Request) -> web.Response:
+    """
+    Handle incoming webhook updates.
+    
+    The update is scheduled on the event loop and acknowledged right
+    away, so Telegram's delivery does not wait for the handlers.
+    """
     try:
         if application is None:
-            return jsonify({"error": "Bot not initialized"}), 500
+            return web.json_response({"error": "Bot not initialized"}, status=500)
             
         # Get the update from Telegram
-        update = Update.de_json(request.get_json(), application.bot)
+        update = Update.de_json(await request.json(), application.bot)
         
-        # Process the update
-        await application.process_update(update)
+        # Process the update in the background
+        task = asyncio.create_task(_process_update(update))
+        _pending_updates.add(task)
+        task.add_done_callback(_pending_updates.discard)
         
-        return jsonify({"status": "ok"})
+        return web.Response(body=_OK_BODY, content_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error processing webhook: {e}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Error processing webhook: %s", e)
+        return web.json_response({"error": "Internal server error"}, status=500)
 
-def create_app():
-    """Initialize the bot application"""
+async def start_bot(app: web.Application) -> None:
+    """Initialize and start the bot application (on_startup hook)."""
     global application
     
     try:
@@ -62,30 +83,57 @@ def create_app():
         if not token:
             raise ValueError("BOT_TOKEN environment variable not set")
         
-        # Create application
-        application = Application.builder().token(token).build()
+        # Same handlers, request pool and rate limiter as polling mode
+        application = build_application()
         
-        # Register handlers
-        try:
-            from handlers.user_handlers import register_user_handlers
-            register_user_handlers(application)
-            logger.info("User handlers registered")
-        except ImportError as e:
-            logger.error(f"Failed to import user handlers: {e}")
+        # initialize() calls getMe, so the connection to the Bot API is
+        # warm before the first update arrives
+        await application.initialize()
+        await application.start()
         
         # Set webhook
         webhook_url = os.getenv('WEBHOOK_URL')  # Set this in Render environment
         if webhook_url:
-            application.bot.set_webhook(url=f"{webhook_url}/webhook")
-            logger.info(f"Webhook set to: {webhook_url}/webhook")
+            # Let Telegram deliver up to 100 updates concurrently (the API
+            # maximum), and only the update types the handlers consume
+            await application.bot.set_webhook(
+                url=f"{webhook_url}/webhook",
+                max_connections=100,
+                allowed_updates=ALLOWED_UPDATES
+            )
+            logger.info("Webhook set to: %s/webhook", webhook_url)
         
         logger.info("Bot application initialized successfully")
         
     except Exception as e:
-        logger.error(f"Failed to initialize bot: {e}")
+        logger.error("Failed to initialize bot: %s", e)
         raise
 
+async def stop_bot(app: web.Application) -> None:
+    """Stop the bot application (on_cleanup hook)."""
+    if application is not None:
+        if _pending_updates:
+            await asyncio.gather(*_pending_updates, return_exceptions=True)
+        await application.stop()
+        await application.shutdown()
+
+def create_app() -> web.Application:
+    """Create the webhook server application."""
+    app = web.Application()
+    app.router.add_get('/', home)
+    app.router.add_get('/health', health)
+    app.router.add_post('/webhook', webhook)
+    app.on_startup.append(start_bot)
+    app.on_cleanup.append(stop_bot)
+    return app
+
 if __name__ == '__main__':
-    create_app()
+    # Use uvloop's event loop when available (not supported on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        logger.info("uvloop not available, using the default asyncio event loop")
+    
     port = int(os.environ.get('PORT', 10000))
-    app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
+    web.run_app(create_app(), host='0.0.0.0', port=port, access_log=None)